@@ -2,10 +2,25 @@ from manim import *
 from manim_fontawesome import solid
 
 from util.intro import displayLogo, displayTitle
+from util.palette import DEFAULT_PALETTE
+from util.stacked import stacked
 from util.utils import displayNumberPlane
 
 
 class ObliviousTransferAnimation(Scene):
+    # Variant parameters, overridden by the variant runner (see util/variants.py)
+    title_text = "Oblivious Transfer"
+    intro_text = "Ensure receiver gets one value without sender knowing which one"
+    party_names = ("Alice (Sender)", "Bob (Receiver)")
+    palette = DEFAULT_PALETTE
+
+    @classmethod
+    def party_name(cls, index):
+        """
+        Returns a party's name without its role, e.g. "Alice" for "Alice (Sender)".
+        """
+        return cls.party_names[index].split(" (")[0]
+
     def construct(self):
 
         # Show Coordinates
@@ -15,15 +30,11 @@ class ObliviousTransferAnimation(Scene):
         displayLogo(self)
 
         # Display title and introduction
-        displayTitle(
-            self,
-            "Oblivious Transfer",
-            "Ensure receiver gets one value without sender knowing which one",
-        )
+        displayTitle(self, self.title_text, self.intro_text)
 
         # Create the two parties
-        sender = self.create_party("Alice (Sender)", LEFT * 4.5 + UP * 1.5)
-        receiver = self.create_party("Bob (Receiver)", RIGHT * 4.5 + UP * 1.5)
+        sender = self.create_party(self.party_names[0], LEFT * 4.5 + UP * 1.5)
+        receiver = self.create_party(self.party_names[1], RIGHT * 4.5 + UP * 1.5)
         self.sender = sender
         self.receiver = receiver
 
@@ -38,29 +49,34 @@ class ObliviousTransferAnimation(Scene):
         self.play(Create(messages))
 
         # Show Bob's choice
-        choice_text = Text("Bob wants to receive m₁", font_size=24, color=YELLOW)
+        choice_text = Text(
+            f"{self.party_name(1)} wants to receive m₁",
+            font_size=24,
+            color=self.palette["highlight"],
+        )
         choice_text.next_to(receiver, DOWN, buff=0.8)
 
         choice_arrow = Arrow(
             receiver.get_bottom() + DOWN * 0.2,
             choice_text.get_top(),
             buff=0.1,
-            color=YELLOW,
+            color=self.palette["highlight"],
         )
 
         self.play(Write(choice_text), Create(choice_arrow))
         self.wait(1)
 
         # Highlight Bob's choice
-        highlight = SurroundingRectangle(messages[1], color=YELLOW)
+        highlight = SurroundingRectangle(messages[1], color=self.palette["highlight"])
         self.play(Create(highlight))
         self.wait(1)
 
         # Show the challenge of OT
         challenge_text = Text(
-            "Challenge: Bob should receive only m₁ without Alice knowing " "his choice",
+            f"Challenge: {self.party_name(1)} should receive only m₁ without "
+            f"{self.party_name(0)} knowing their choice",
             font_size=24,
-            color=YELLOW,
+            color=self.palette["highlight"],
         )
         challenge_text.to_edge(DOWN, buff=1)
         self.play(Write(challenge_text))
@@ -110,21 +126,21 @@ class ObliviousTransferAnimation(Scene):
 
         # Create message boxes
         m0_box = Rectangle(height=0.8, width=1.2, color=WHITE)
-        m0_box.set_fill(color=RED, opacity=0.2)
+        m0_box.set_fill(color=self.palette["reject"], opacity=0.2)
         m0_label = MathTex(r"m_0")
         m0_label.scale(0.5)
         m0_label.move_to(m0_box.get_center())
         m0 = VGroup(m0_box, m0_label)
 
         m1_box = Rectangle(height=0.8, width=1.2, color=WHITE)
-        m1_box.set_fill(color=GREEN, opacity=0.2)
+        m1_box.set_fill(color=self.palette["accept"], opacity=0.2)
         m1_label = MathTex(r"m_1")
         m1_label.scale(0.5)
         m1_label.move_to(m1_box.get_center())
         m1 = VGroup(m1_box, m1_label)
 
         m2_box = Rectangle(height=0.8, width=1.2, color=WHITE)
-        m2_box.set_fill(color=RED, opacity=0.2)
+        m2_box.set_fill(color=self.palette["reject"], opacity=0.2)
         m2_label = MathTex(r"m_2")
         m2_label.scale(0.5)
         m2_label.move_to(m2_box.get_center())
@@ -138,7 +154,7 @@ class ObliviousTransferAnimation(Scene):
         messages.add(m0, m1, m2)
 
         # Add title
-        messages_title = Text("Alice's Messages", font_size=20)
+        messages_title = Text(f"{self.party_name(0)}'s Messages", font_size=20)
         messages_title.next_to(messages, UP, buff=0.3)
         messages.add(messages_title)
 
@@ -150,24 +166,24 @@ class ObliviousTransferAnimation(Scene):
 
         # Step 1: Bob generates keys
         step1_text = Tex(
-            r"1. Bob generates 3 public keys ($pk_0, pk_1, pk_2$)",
+            rf"1. {self.party_name(1)} generates 3 public keys ($pk_0, pk_1, pk_2$)",
             font_size=STEP_TEXT_FONT_SIZE,
         )
         step1_text.center()
 
-        key0 = Rectangle(height=0.5, width=0.5, color=RED)
+        key0 = Rectangle(height=0.5, width=0.5, color=self.palette["reject"])
         key0_label = MathTex(r"pk_0")
         key0_label.scale(0.5)
         key0_label.move_to(key0.get_center())
         pk0 = VGroup(key0, key0_label)
 
-        key1 = Rectangle(height=0.5, width=0.5, color=GREEN)
+        key1 = Rectangle(height=0.5, width=0.5, color=self.palette["accept"])
         key1_label = MathTex(r"pk_1")
         key1_label.scale(0.5)
         key1_label.move_to(key1.get_center())
         pk1 = VGroup(key1, key1_label)
 
-        key2 = Rectangle(height=0.5, width=0.5, color=RED)
+        key2 = Rectangle(height=0.5, width=0.5, color=self.palette["reject"])
         key2_label = MathTex(r"pk_2")
         key2_label.scale(0.5)
         key2_label.move_to(key2.get_center())
@@ -179,12 +195,14 @@ class ObliviousTransferAnimation(Scene):
         keys.next_to(self.receiver, DOWN, buff=1.5)
 
         # Add title
-        keys_title = Text("Bob's Keys", font_size=20)
+        keys_title = Text(f"{self.party_name(1)}'s Keys", font_size=20)
         keys_title.next_to(keys, UP, buff=0.3)
         # keys.add(keys_title)
 
         # Show Bob's choice (pk1 is the "real" key)
-        choice_indicator = Text("(Bob knows the secret key only for pk₁)", font_size=16)
+        choice_indicator = Text(
+            f"({self.party_name(1)} knows the secret key only for pk₁)", font_size=16
+        )
         choice_indicator.next_to(keys, DOWN, buff=0.3)
 
         self.play(Write(step1_text))
@@ -193,7 +211,8 @@ class ObliviousTransferAnimation(Scene):
 
         # Step 2: Bob sends all keys to Alice
         step2_text = Tex(
-            r"2. Bob sends all public keys ($pk_0, pk_1, pk_2$) to Alice",
+            rf"2. {self.party_name(1)} sends all public keys ($pk_0, pk_1, pk_2$) to "
+            rf"{self.party_name(0)}",
             font_size=STEP_TEXT_FONT_SIZE,
         )
         step2_text.move_to(step1_text.get_center())
@@ -202,14 +221,14 @@ class ObliviousTransferAnimation(Scene):
             self.receiver.get_center() + LEFT * 2,
             self.sender.get_center() + RIGHT * 2,
             buff=0.2,
-            color=YELLOW_C,
+            color=self.palette["transfer"],
         )
 
         self.play(ReplacementTransform(step1_text, step2_text), Create(key_transfer))
 
         # Animate keys moving to Alice
         keys_copy = keys.copy()
-        self.play(keys_copy.animate.next_to(self.sender, DOWN, buff=2))
+        self.play(stacked(keys_copy.animate.next_to(self.sender, DOWN, buff=2)))
         self.wait(1)
 
         # Fade out the key transfer arrow before step 3
@@ -217,21 +236,22 @@ class ObliviousTransferAnimation(Scene):
 
         # Step 3: Alice encrypts her messages
         step3_text = Tex(
-            r"3. Alice encrypts each message with the corresponding key",
+            rf"3. {self.party_name(0)} encrypts each message with the "
+            r"corresponding key",
             font_size=STEP_TEXT_FONT_SIZE,
         )
         step3_text.move_to(step2_text.get_center())
 
         # Create encrypted messages
         enc_m0 = Rectangle(height=0.8, width=1.4, color=WHITE)
-        enc_m0.set_fill(color=RED, opacity=0.2)
+        enc_m0.set_fill(color=self.palette["reject"], opacity=0.2)
         enc_m0_label = MathTex(r"Enc(pk_0, m_0)")
         enc_m0_label.scale(0.4)
         enc_m0_label.move_to(enc_m0.get_center())
         encrypted_m0 = VGroup(enc_m0, enc_m0_label)
 
         enc_m1 = enc_m0.copy()
-        enc_m1.set_fill(color=GREEN, opacity=0.2)
+        enc_m1.set_fill(color=self.palette["accept"], opacity=0.2)
         enc_m1_label = enc_m0_label.copy()
         enc_m1_label.move_to(enc_m1.get_center())
         encrypted_m1 = VGroup(enc_m1, enc_m1_label)
@@ -274,7 +294,8 @@ class ObliviousTransferAnimation(Scene):
 
         # Step 4: Alice sends encrypted messages to Bob
         step4_text = Tex(
-            r"4. Alice sends all encrypted messages to Bob",
+            rf"4. {self.party_name(0)} sends all encrypted messages to "
+            rf"{self.party_name(1)}",
             font_size=STEP_TEXT_FONT_SIZE,
         )
         step4_text.move_to(step3_text.get_center())
@@ -283,7 +304,7 @@ class ObliviousTransferAnimation(Scene):
             encrypted_messages.get_right() + RIGHT * 0.5,
             encrypted_messages.get_right() + RIGHT * 3.5,
             buff=0.2,
-            color=YELLOW_C,
+            color=self.palette["transfer"],
             stroke_opacity=0.5,
         )
 
@@ -294,7 +315,9 @@ class ObliviousTransferAnimation(Scene):
         # Animate messages moving to Bob
         encrypted_messages_copy = encrypted_messages.copy()
         self.play(
-            encrypted_messages_copy.animate.next_to(self.receiver, DOWN, buff=3),
+            stacked(
+                encrypted_messages_copy.animate.next_to(self.receiver, DOWN, buff=3)
+            ),
             FadeOut(lock0),
             FadeOut(lock1),
         )
@@ -305,18 +328,23 @@ class ObliviousTransferAnimation(Scene):
 
         # Step 5: Bob decrypts only one message
         step5_text = Tex(
-            r"5. Bob can decrypt only $m_1$ using his secret key for $pk_1$",
+            rf"5. {self.party_name(1)} can decrypt only $m_1$ using their secret key "
+            r"for $pk_1$",
             font_size=STEP_TEXT_FONT_SIZE,
         )
         step5_text.move_to(step4_text.get_center())
 
         # Show decryption process
-        decrypt_fail = Text("x Can't Decrypt", font_size=18, color=RED)
+        decrypt_fail = Text(
+            "x Can't Decrypt", font_size=18, color=self.palette["reject"]
+        )
         decrypt_fail.next_to(encrypted_messages_copy[0], DOWN, buff=0.2)
         decrypt_fail_2 = decrypt_fail.copy()
         decrypt_fail_2.next_to(encrypted_messages_copy[2], DOWN, buff=0.2)
 
-        decrypt_success = Text("✓ Can Decrypt", font_size=18, color=GREEN)
+        decrypt_success = Text(
+            "✓ Can Decrypt", font_size=18, color=self.palette["accept"]
+        )
         decrypt_success.next_to(encrypted_messages_copy[1], DOWN, buff=0.2)
 
         self.play(
@@ -327,13 +355,17 @@ class ObliviousTransferAnimation(Scene):
         )
 
         # Highlight the message Bob can decrypt
-        highlight = SurroundingRectangle(encrypted_messages_copy[1], color=YELLOW)
+        highlight = SurroundingRectangle(
+            encrypted_messages_copy[1], color=self.palette["highlight"]
+        )
         self.play(Create(highlight))
         self.wait(1)
 
         # Show final decrypted message
-        decrypted_message = Rectangle(height=0.8, width=1.2, color=YELLOW)
-        decrypted_message.set_fill(color=GREEN, opacity=0.3)
+        decrypted_message = Rectangle(
+            height=0.8, width=1.2, color=self.palette["highlight"]
+        )
+        decrypted_message.set_fill(color=self.palette["accept"], opacity=0.3)
         decrypted_label = Text("m₁", font_size=24)
         decrypted_label.move_to(decrypted_message.get_center())
         final_message = VGroup(decrypted_message, decrypted_label)
@@ -346,13 +378,13 @@ class ObliviousTransferAnimation(Scene):
             encrypted_messages_copy[1].get_top() + UP * 0.1,
             final_message.get_right() + RIGHT * 0.1,
             angle=TAU / 6,
-            color=GREEN,
+            color=self.palette["accept"],
         )
 
         # Add a "decrypted" label next to the arrow
         decrypt_label = solid.unlock.copy()
         decrypt_label.scale(0.2)  # Make it smaller
-        decrypt_label.set_color(GREEN)  # Set color to green
+        decrypt_label.set_color(self.palette["accept"])  # Set color to green
         # Position it at the midpoint of the curve
         decrypt_label.move_to(
             final_message.get_right() + RIGHT * 0.5
@@ -366,12 +398,15 @@ class ObliviousTransferAnimation(Scene):
         step6_text.center().move_to(UP * 0.5)
 
         property1 = Text(
-            "• Alice doesn't learn which message Bob received", font_size=22
+            f"• {self.party_name(0)} doesn't learn which message "
+            f"{self.party_name(1)} received",
+            font_size=22,
         )
         property1.next_to(step6_text, DOWN, buff=0.3)
 
         property2 = Text(
-            "• Bob learns exactly one message and nothing about the others",
+            f"• {self.party_name(1)} learns exactly one message and nothing about "
+            "the others",
             font_size=22,
         )
         property2.next_to(property1, DOWN, buff=0.2)
@@ -402,6 +437,19 @@ class ObliviousTransferAnimation(Scene):
 
 
 class SingleGarbledGateAnimation(MovingCameraScene):
+    # Variant parameters, overridden by the variant runner (see util/variants.py)
+    title_text = "Garbled Gate"
+    intro_text = "A gate that hides its inputs and functionality"
+    party_names = ("Alice (Garbler)", "Bob (Evaluator)")
+    palette = DEFAULT_PALETTE
+
+    @classmethod
+    def party_name(cls, index):
+        """
+        Returns a party's name without its role, e.g. "Alice" for "Alice (Sender)".
+        """
+        return cls.party_names[index].split(" (")[0]
+
     def construct(self):
 
         self.STEP_TEXT_FONT_SIZE = 30
@@ -414,15 +462,11 @@ class SingleGarbledGateAnimation(MovingCameraScene):
         displayLogo(self)
 
         # Display title and introduction
-        displayTitle(
-            self,
-            "Garbled Gate",
-            "A gate that hides its inputs and functionality",
-        )
+        displayTitle(self, self.title_text, self.intro_text)
 
         # Create the two parties
-        alice = self.create_party("Alice (Garbler)", LEFT * 5 + UP * 2.5)
-        bob = self.create_party("Bob (Evaluator)", RIGHT * 5 + UP * 2.5)
+        alice = self.create_party(self.party_names[0], LEFT * 5 + UP * 2.5)
+        bob = self.create_party(self.party_names[1], RIGHT * 5 + UP * 2.5)
         self.alice = alice
         self.bob = bob
 
@@ -482,7 +526,7 @@ class SingleGarbledGateAnimation(MovingCameraScene):
         gate = VGroup()
         # Gate body
         body = Rectangle(height=1.2, width=1.5, color=WHITE)
-        body.set_fill(color=GREEN, opacity=0.2)
+        body.set_fill(color=self.palette["accept"], opacity=0.2)
         # Gate label
         label = Text("AND", font_size=24)
         label.move_to(body.get_center())
@@ -558,22 +602,22 @@ class SingleGarbledGateAnimation(MovingCameraScene):
         title = Text("Garbled Truth Table", font_size=24)
         # Create encrypted entries
         entry1 = Rectangle(height=0.6, width=2.5, color=WHITE)
-        entry1.set_fill(color=RED, opacity=0.2)
+        entry1.set_fill(color=self.palette["reject"], opacity=0.2)
         entry1_label = Tex(r"$(0,0) | Enc_{P_{0,0}}(G(0,0))$", font_size=22)
         entry1_label.move_to(entry1.get_center())
         entry1_group = VGroup(entry1, entry1_label)
         entry2 = Rectangle(height=0.6, width=2.5, color=WHITE)
-        entry2.set_fill(color=RED, opacity=0.2)
+        entry2.set_fill(color=self.palette["reject"], opacity=0.2)
         entry2_label = Tex(r"$(0,1) | Enc_{P_{0,1}}(G(0,1))$", font_size=22)
         entry2_label.move_to(entry2.get_center())
         entry2_group = VGroup(entry2, entry2_label)
         entry3 = Rectangle(height=0.6, width=2.5, color=WHITE)
-        entry3.set_fill(color=RED, opacity=0.2)
+        entry3.set_fill(color=self.palette["reject"], opacity=0.2)
         entry3_label = Tex(r"$(1,0) | Enc_{P_{1,0}}(G(1,0))$", font_size=22)
         entry3_label.move_to(entry3.get_center())
         entry3_group = VGroup(entry3, entry3_label)
         entry4 = Rectangle(height=0.6, width=2.5, color=WHITE)
-        entry4.set_fill(color=GREEN, opacity=0.2)
+        entry4.set_fill(color=self.palette["accept"], opacity=0.2)
         entry4_label = Tex(r"$(1,1) | Enc_{P_{1,1}}(G(1,1))$", font_size=22)
         entry4_label.move_to(entry4.get_center())
         entry4_group = VGroup(entry4, entry4_label)
@@ -622,7 +666,7 @@ class SingleGarbledGateAnimation(MovingCameraScene):
 
     def animate_gate_creation(self):
         step_text = Text(
-            "Step 1: Alice creates an AND gate",
+            f"Step 1: {self.party_name(0)} creates an AND gate",
             font_size=self.STEP_TEXT_FONT_SIZE,
         )
         step_text.to_edge(DOWN, buff=self.STEP_TEXT_BUFF)
@@ -649,14 +693,15 @@ class SingleGarbledGateAnimation(MovingCameraScene):
 
     def animate_garbling(self):
         step_text = Text(
-            "Step 2: Alice garbles the gate by encrypting the input labels and outputs",
+            f"Step 2: {self.party_name(0)} garbles the gate by encrypting the input "
+            "labels and outputs",
             font_size=self.STEP_TEXT_FONT_SIZE,
         )
         step_text.to_edge(DOWN, buff=self.STEP_TEXT_BUFF)
         self.play(Write(step_text))
 
         # Make AND gate smaller and move it closer to Alice
-        self.play(self.gate.animate.set_fill(color=RED))
+        self.play(self.gate.animate.set_fill(color=self.palette["reject"]))
         self.play(self.gate.animate.scale(0.5))
         self.play(self.gate.animate.next_to(self.alice, DOWN, buff=0.5))
         self.wait(1)
@@ -681,7 +726,7 @@ class SingleGarbledGateAnimation(MovingCameraScene):
         # )
         self.play(
             # move the garbled table to the center of the scene
-            garbled_table.animate.next_to(self.alice, DOWN * 6),
+            stacked(garbled_table.animate.next_to(self.alice, DOWN * 6)),
         )
         self.wait(1)
         # Store garbled table and label mapping for later use
@@ -692,7 +737,8 @@ class SingleGarbledGateAnimation(MovingCameraScene):
 
     def animate_gate_transfer(self):
         step_text = Text(
-            "Step 3: Alice sends the garbled gate to Bob",
+            f"Step 3: {self.party_name(0)} sends the garbled gate to "
+            f"{self.party_name(1)}",
             font_size=self.STEP_TEXT_FONT_SIZE,
         )
         step_text.to_edge(DOWN, buff=self.STEP_TEXT_BUFF)
@@ -702,7 +748,7 @@ class SingleGarbledGateAnimation(MovingCameraScene):
             self.alice.get_right() + RIGHT * 0.5,
             self.bob.get_left() + LEFT * 0.5,
             buff=0.2,
-            color=YELLOW_C,
+            color=self.palette["transfer"],
         )
 
         # Show transfer
@@ -711,8 +757,8 @@ class SingleGarbledGateAnimation(MovingCameraScene):
         gate_copy = self.gate.copy()
         garbled_table_copy = self.garbled_table.copy()
         self.play(
-            gate_copy.animate.next_to(self.bob, DOWN, buff=0.5),
-            garbled_table_copy.animate.next_to(self.bob, DOWN * 6),
+            stacked(gate_copy.animate.next_to(self.bob, DOWN, buff=0.5)),
+            stacked(garbled_table_copy.animate.next_to(self.bob, DOWN * 6)),
         )
         self.wait(1)
         # Store Bob's copies
@@ -726,55 +772,66 @@ class SingleGarbledGateAnimation(MovingCameraScene):
 
     def animate_evaluation(self):
         step_text = Text(
-            "Step 4: Bob evaluates the garbled gate with his inputs",
+            f"Step 4: {self.party_name(1)} evaluates the garbled gate with their "
+            "inputs",
             font_size=self.STEP_TEXT_FONT_SIZE,
         )
         step_text.to_edge(DOWN, buff=self.STEP_TEXT_BUFF)
         self.play(Write(step_text))
         # Create Bob's input labels
-        input_a = Text("Input A=1", font_size=20, color=YELLOW)
+        input_a = Text("Input A=1", font_size=20, color=self.palette["highlight"])
         input_a.next_to(self.bob_gate, LEFT + UP * 0.5, buff=0.1)
-        input_b = Text("Input B=1", font_size=20, color=YELLOW)
+        input_b = Text("Input B=1", font_size=20, color=self.palette["highlight"])
         input_b.next_to(self.bob_gate, LEFT + DOWN * 0.5, buff=0.1)
         # Show Bob's inputs
         self.play(Write(input_a), Write(input_b))
         self.wait(1)
         # Highlight the corresponding entry in the garbled table (entry4)
-        highlight = SurroundingRectangle(self.bob_garbled_table[1][3], color=YELLOW)
+        highlight = SurroundingRectangle(
+            self.bob_garbled_table[1][3], color=self.palette["highlight"]
+        )
         self.play(Create(highlight))
         self.wait(1)
 
         # Show final output
         self.play(
-            self.bob.animate.move_to(self.bob.get_center() + LEFT * 2),
-            input_a.animate.move_to(input_a.get_center() + LEFT * 2),
-            input_b.animate.move_to(input_b.get_center() + LEFT * 2),
-            highlight.animate.move_to(highlight.get_center() + LEFT * 2),
-            self.bob_gate.animate.move_to(self.bob_gate.get_center() + LEFT * 2),
-            self.bob_garbled_table.animate.move_to(
-                self.bob_garbled_table.get_center() + LEFT * 2
+            stacked(self.bob.animate.move_to(self.bob.get_center() + LEFT * 2)),
+            stacked(input_a.animate.move_to(input_a.get_center() + LEFT * 2)),
+            stacked(input_b.animate.move_to(input_b.get_center() + LEFT * 2)),
+            stacked(highlight.animate.move_to(highlight.get_center() + LEFT * 2)),
+            stacked(
+                self.bob_gate.animate.move_to(self.bob_gate.get_center() + LEFT * 2)
+            ),
+            stacked(
+                self.bob_garbled_table.animate.move_to(
+                    self.bob_garbled_table.get_center() + LEFT * 2
+                )
             ),
         )
         self.wait(1)
 
         # Show Bob decrypting the output
-        decrypt_text = Text("Decrypt to get G(1,1)", font_size=20, color=GREEN)
+        decrypt_text = Text(
+            "Decrypt to get G(1,1)", font_size=20, color=self.palette["accept"]
+        )
         decrypt_text.next_to(highlight, RIGHT, buff=0.5)
         self.play(Write(decrypt_text))
         self.wait(1)
 
         # Show the decrypted output
-        output_text = Text("Output: A∧B = 1", font_size=18, color=GREEN)
+        output_text = Text(
+            "Output: A∧B = 1", font_size=18, color=self.palette["accept"]
+        )
         output_text.next_to(self.bob, RIGHT, buff=0)
         output_arrow = CurvedArrow(
             self.bob_garbled_table.get_right() + RIGHT * 0.5,
             self.bob_garbled_table.get_right() + RIGHT * 0.5 + UP * 3,
-            color=GREEN,
+            color=self.palette["accept"],
         )
         # Add a "decrypted" label next to the arrow
         decrypt_label = solid.unlock.copy()
         decrypt_label.scale(0.2)  # Make it smaller
-        decrypt_label.set_color(GREEN)  # Set color to green
+        decrypt_label.set_color(self.palette["accept"])  # Set color to green
         # Position it at the midpoint of the curve
         decrypt_label.move_to(
             output_arrow.get_right() + RIGHT * 0.5
@@ -789,7 +846,8 @@ class SingleGarbledGateAnimation(MovingCameraScene):
 
         # Explain security properties
         security_text1 = Text(
-            "Bob learns only the output for his inputs. Alice doesn't learn Bob's inputs",
+            f"{self.party_name(1)} learns only the output for their inputs. "
+            f"{self.party_name(0)} doesn't learn {self.party_name(1)}'s inputs",
             font_size=27,
         )
         security_text1.to_edge(DOWN, buff=self.STEP_TEXT_BUFF)
@@ -0,0 +1,223 @@
+import argparse
+import importlib
+import sys
+import time
+
+from manim import *
+
+from util.frame_ring import (
+    RingBufferFileWriterMixin,
+    RingBufferRendererMixin,
+    ThroughputFileWriterMixin,
+)
+from util.golden import GoldenFrameFileWriterMixin, golden_failures
+from util.layered import LayeredRendererMixin
+from util.memory_budget import MemoryBudgetFileWriterMixin, MemoryBudgetRendererMixin
+from util.preflight import preflight
+from util.renderer import build_scene
+from util.stacked import (
+    StackedInterpolationMixin,
+    benchmark_interpolation,
+    interpolation_time,
+)
+from util.streaming import StreamingFileWriterMixin
+from util.vector_export import VectorTimelineRendererMixin
+from util.variants import VARIANTS, load_variants, make_variant, render_variants
+
+# The scene file name starts with a digit, so it can't be imported directly
+scenes = importlib.import_module("2pc")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render scenes from src/2pc.py")
+    parser.add_argument("scenes", nargs="*", help="names of the scenes to render")
+    parser.add_argument(
+        "-q",
+        "--quality",
+        choices=list(QUALITIES),
+        help="render quality (defaults to the one in manim.cfg)",
+    )
+    parser.add_argument(
+        "-n",
+        "--animations",
+        metavar="START[,END]",
+        help="render only the animations from START (to END), like manim's -n",
+    )
+    parser.add_argument(
+        "--variants",
+        nargs="?",
+        const="",
+        metavar="TABLE",
+        help="render every variant of a JSON variant table "
+        "(the example table in util/variants.py if no file is given)",
+    )
+    parser.add_argument(
+        "--stream",
+        nargs="?",
+        type=float,
+        const=StreamingFileWriterMixin.segment_duration,
+        metavar="SECONDS",
+        help="also write an HLS stream of fixed-length segments while rendering",
+    )
+    parser.add_argument(
+        "--stream-only",
+        action="store_true",
+        help="write only the HLS stream, skipping partial movies and the combine step",
+    )
+    parser.add_argument(
+        "--frame-transport",
+        choices=["queue", "ring"],
+        default="queue",
+        help="hand frames to the encoder through manim's queue, or through a "
+        "shared-memory ring to a separate encoder process",
+    )
+    parser.add_argument(
+        "--throughput",
+        action="store_true",
+        help="report how fast frames reach the encoder",
+    )
+    parser.add_argument(
+        "--vector",
+        action="store_true",
+        help="also export the scene as a keyframed vector timeline with a player",
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help="build all text, TeX and icon assets in a process pool before rendering",
+    )
+    parser.add_argument(
+        "--unstacked",
+        action="store_true",
+        help="interpolate every submobject separately, to compare against stacking",
+    )
+    parser.add_argument(
+        "--interpolation-time",
+        action="store_true",
+        help="report the time spent interpolating stacked transforms",
+    )
+    parser.add_argument(
+        "--benchmark-interpolation",
+        nargs="?",
+        type=int,
+        const=1000,
+        metavar="BOXES",
+        help="time per-submobject against stacked interpolation on a synthetic "
+        "scene of BOXES boxes (1000 by default)",
+    )
+    parser.add_argument(
+        "--golden",
+        choices=["record", "compare"],
+        help="record a golden manifest of frame hashes, or compare against it",
+    )
+    parser.add_argument(
+        "--golden-every-frame",
+        action="store_true",
+        help="hash every frame instead of the end frame of each play",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=int,
+        metavar="MB",
+        help="keep the RSS under MB by evicting caches and spilling data to disk",
+    )
+    parser.add_argument(
+        "--layered",
+        action="store_true",
+        help="cache static mobjects as layers and redraw only what moves",
+    )
+    args = parser.parse_args()
+    if not args.scenes and args.benchmark_interpolation is None:
+        parser.error("no scenes given")
+
+    # Write to media/videos/2pc/... like `manim src/2pc.py` does
+    config.input_file = scenes.__file__
+    if args.quality:
+        config.quality = args.quality
+    if args.animations:
+        start, _, end = args.animations.partition(",")
+        config.from_animation_number = int(start)
+        if end:
+            config.upto_animation_number = int(end)
+
+    build_options = {"file_writer_mixins": [], "renderer_mixins": []}
+    if args.throughput:
+        build_options["file_writer_mixins"].append(ThroughputFileWriterMixin)
+    if args.frame_transport == "ring":
+        if config.transparent or config.movie_file_extension != ".mp4":
+            parser.error("the ring frame transport only writes opaque mp4 files")
+        if args.stream is not None or args.stream_only:
+            # Streaming keeps references to frames that the ring reuses
+            parser.error("the ring frame transport can't be combined with streaming")
+        if args.memory_budget is not None:
+            # Spilling a frame copies it out of its slot, which then never frees
+            parser.error(
+                "the ring frame transport can't be combined with a memory budget"
+            )
+        build_options["file_writer_mixins"].append(RingBufferFileWriterMixin)
+        build_options["renderer_mixins"].append(RingBufferRendererMixin)
+    if args.stream is not None or args.stream_only:
+        build_options["file_writer_mixins"].append(StreamingFileWriterMixin)
+        build_options["stream_only"] = args.stream_only
+        if args.stream is not None:
+            build_options["segment_duration"] = args.stream
+    if args.vector:
+        # Cached plays aren't rendered, so they couldn't be recorded
+        config.disable_caching = True
+        build_options["renderer_mixins"].append(VectorTimelineRendererMixin)
+    if args.golden:
+        if args.frame_transport == "ring":
+            parser.error("--golden can't be combined with the ring frame transport")
+        # Cached plays write no frames, so there would be nothing to hash
+        config.disable_caching = True
+        build_options["file_writer_mixins"].append(GoldenFrameFileWriterMixin)
+        build_options["golden_mode"] = args.golden
+        build_options["golden_every_frame"] = args.golden_every_frame
+    if args.layered:
+        build_options["renderer_mixins"].append(LayeredRendererMixin)
+    if args.memory_budget is not None:
+        build_options["file_writer_mixins"].append(MemoryBudgetFileWriterMixin)
+        build_options["renderer_mixins"].append(MemoryBudgetRendererMixin)
+        build_options["memory_budget"] = args.memory_budget
+    if args.unstacked:
+        StackedInterpolationMixin.stacking_enabled = False
+    if args.benchmark_interpolation is not None:
+        benchmark_interpolation(args.benchmark_interpolation)
+
+    for scene_name in args.scenes:
+        scene_cls = getattr(scenes, scene_name)
+        if args.variants is not None:
+            variants = load_variants(args.variants) if args.variants else VARIANTS
+            scene_classes = [make_variant(scene_cls, variant) for variant in variants]
+        else:
+            scene_classes = [scene_cls]
+
+        warm_up_time = preflight(*scene_classes) if args.preflight else 0
+        interpolation_time["seconds"] = 0
+        start = time.perf_counter()
+        if args.variants is not None:
+            render_variants(scene_cls, variants, **build_options)
+        else:
+            build_scene(scene_cls, **build_options).render()
+        animation_time = time.perf_counter() - start
+
+        if args.preflight:
+            total_time = warm_up_time + animation_time
+            logger.info(
+                f"{scene_name}: warm-up {warm_up_time:.2f}s "
+                f"({warm_up_time / total_time:.0%}), "
+                f"animation {animation_time:.2f}s ({animation_time / total_time:.0%})"
+            )
+        if args.interpolation_time or args.unstacked:
+            logger.info(
+                f"{scene_name}: {interpolation_time['seconds']:.2f}s interpolating "
+                f"{'per submobject' if args.unstacked else 'stacked'} transforms"
+            )
+
+    if golden_failures:
+        logger.error(f"Frames differ from the golden manifest: {golden_failures}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
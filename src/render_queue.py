@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import importlib
+import json
+import shlex
+import sys
+
+from manim import *
+
+from util.render_queue import RenderQueue
+
+# The scene file name starts with a digit, so it can't be imported directly
+scenes = importlib.import_module("2pc")
+
+
+def request_parser():
+    parser = argparse.ArgumentParser(prog="request", exit_on_error=False)
+    parser.add_argument("scene", help="name of the scene to render")
+    parser.add_argument("-q", "--quality", choices=list(QUALITIES))
+    parser.add_argument("-n", "--animations", metavar="START[,END]")
+    parser.add_argument(
+        "-p", "--priority", type=int, default=0, help="lower numbers run first"
+    )
+    return parser
+
+
+async def read_requests(queue):
+    """
+    Submits one render request per line of stdin until it is closed.
+    """
+    parser = request_parser()
+    reader = asyncio.StreamReader()
+    await asyncio.get_running_loop().connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+    )
+    while line := (await reader.readline()).decode():
+        if not line.strip():
+            continue
+        if line.strip() == "metrics":
+            print(json.dumps(queue.metrics(), indent=2), flush=True)
+            continue
+        try:
+            request = parser.parse_args(shlex.split(line))
+        except (argparse.ArgumentError, SystemExit) as error:
+            logger.error(f"Invalid request {line.strip()!r}: {error}")
+            continue
+        if not isinstance(getattr(scenes, request.scene, None), type):
+            logger.error(f"No scene named {request.scene} in src/2pc.py")
+            continue
+        queue.submit(
+            request.scene, request.quality, request.animations, request.priority
+        )
+
+
+async def publish_metrics(queue, path, interval):
+    """
+    Keeps a JSON file with the queue's metrics up to date and logs them.
+    """
+    ticks = 0
+    while True:
+        metrics = queue.metrics()
+        path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+        if ticks % interval == 0:
+            utilization = ", ".join(
+                f"{worker['utilization']:.0%}" for worker in metrics["workers"]
+            )
+            logger.info(
+                f"Render queue: {metrics['queue_depth']} pending, "
+                f"{metrics['running']} running, worker utilization {utilization}"
+            )
+        ticks += 1
+        await asyncio.sleep(1)
+
+
+async def run(args):
+    queue = RenderQueue(num_workers=args.workers)
+    queue.start()
+    metrics_task = asyncio.create_task(
+        publish_metrics(queue, queue.log_dir / "metrics.json", args.metrics_interval)
+    )
+    try:
+        await read_requests(queue)
+        # Stdin is closed, finish what is still queued
+        for jobs in list(queue.active_jobs.values()):
+            for job in list(jobs):
+                await job.done.wait()
+    finally:
+        metrics_task.cancel()
+        await queue.stop()
+    logger.info(f"Render queue: {json.dumps(queue.metrics())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Queue renders of scenes from src/2pc.py. Reads one request "
+        "per line from stdin: SCENE [-q QUALITY] [-n START[,END]] [-p PRIORITY], "
+        "or 'metrics' to print the queue's metrics."
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, help="number of concurrent renders (CPU count)"
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=int,
+        default=10,
+        metavar="SECONDS",
+        help="how often to log the queue depth and worker utilization",
+    )
+    args = parser.parse_args()
+
+    # Resolve media/videos/2pc/... like render.py does
+    config.input_file = scenes.__file__
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
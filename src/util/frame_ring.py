@@ -0,0 +1,261 @@
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty
+from time import perf_counter
+
+import av
+import numpy as np
+from manim import *
+from manim.scene.scene_file_writer import to_av_frame_rate
+
+
+class FrameRing:
+    """
+    Preallocated frame buffers in shared memory, reused in a ring.
+
+    The indices of free slots travel through a queue: the renderer takes one
+    before rasterizing a frame and the encoder puts it back once the frame is
+    encoded, so the renderer blocks when the encoder falls behind.
+
+    Args:
+        shape (tuple): Shape of one RGBA frame
+        num_slots (int): Number of frames that can be in flight at once
+        name (str, optional): Name of an existing ring to attach to
+    """
+
+    def __init__(self, shape, num_slots, name=None):
+        frame_size = int(np.prod(shape))
+        if name is None:
+            self.shm = SharedMemory(create=True, size=frame_size * num_slots)
+        else:
+            self.shm = SharedMemory(name=name)
+        self.slots = [
+            np.ndarray(
+                shape, dtype=np.uint8, buffer=self.shm.buf, offset=i * frame_size
+            )
+            for i in range(num_slots)
+        ]
+
+    def index_of(self, frame):
+        for index, slot in enumerate(self.slots):
+            if frame is slot:
+                return index
+        return None
+
+    def close(self, unlink=False):
+        # The slot arrays export the shared buffer and must go before it
+        self.slots = []
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def run_encoder(ring_name, shape, num_slots, commands, free_slots, closed_files):
+    """
+    Encoder process: encodes ring slots into partial movie files.
+
+    Commands are ``("open", file_path, frame_rate)``, ``("frame", slot,
+    num_frames)``, ``("close",)`` and ``("stop",)``. Every encoded slot is put
+    back on ``free_slots``, every closed file path on ``closed_files``.
+    """
+    ring = FrameRing(shape, num_slots, name=ring_name)
+    while True:
+        command, *args = commands.get()
+        if command == "open":
+            file_path, frame_rate = args
+            container = av.open(file_path, mode="w")
+            stream = container.add_stream(
+                "libx264",
+                rate=to_av_frame_rate(frame_rate),
+                options={"an": "1", "crf": "23"},
+            )
+            stream.pix_fmt = "yuv420p"
+            stream.height, stream.width = shape[:2]
+        elif command == "frame":
+            slot, num_frames = args
+            for _ in range(num_frames):
+                av_frame = av.VideoFrame.from_ndarray(ring.slots[slot], format="rgba")
+                for packet in stream.encode(av_frame):
+                    container.mux(packet)
+            free_slots.put(slot)
+        elif command == "close":
+            for packet in stream.encode():
+                container.mux(packet)
+            container.close()
+            closed_files.put(file_path)
+        elif command == "stop":
+            break
+    ring.close()
+
+
+class RingBufferRendererMixin:
+    """
+    CairoRenderer mixin that rasterizes every frame straight into a slot of the
+    file writer's FrameRing, instead of copying the camera's pixel array.
+    """
+
+    def render(self, scene, time, moving_mobjects):
+        ring = getattr(self.file_writer, "ring", None)
+        if ring is None or self.skip_animations:
+            return super().render(scene, time, moving_mobjects)
+
+        canvas = self.camera.pixel_array
+        self.ring_slot = ring.slots[self.file_writer.acquire_slot()]
+        self.camera.pixel_array = self.ring_slot
+        try:
+            super().render(scene, time, moving_mobjects)
+        finally:
+            # The slot now belongs to the encoder, keep drawing elsewhere
+            self.camera.pixel_array = canvas
+            self.ring_slot = None
+
+    def get_frame(self):
+        # Hand the slot itself to add_frame instead of a copy of it
+        if getattr(self, "ring_slot", None) is not None:
+            return self.ring_slot
+        return super().get_frame()
+
+
+class EncoderQueue:
+    """
+    Stands in for SceneFileWriter's frame queue, so frames written through
+    SceneFileWriter.write_frame go to the encoder process.
+    """
+
+    def __init__(self, file_writer):
+        self.file_writer = file_writer
+
+    def put(self, message):
+        num_frames, frame = message
+        file_writer = self.file_writer
+        slot = file_writer.ring.index_of(frame)
+        if slot is None:
+            slot = file_writer.acquire_slot()
+            np.copyto(file_writer.ring.slots[slot], frame)
+        file_writer.encoder_commands.put(("frame", slot, num_frames))
+
+
+class RingBufferFileWriterMixin:
+    """
+    SceneFileWriter mixin that hands frames to a separate encoder process
+    through a shared-memory FrameRing.
+
+    Used with RingBufferRendererMixin, frames are never copied in Python: Cairo
+    draws into shared memory and the encoder reads from it, encoding one
+    frame while the next one is rendered. Frames still pass through
+    write_frame, whose queue hands them to the encoder; frames from other
+    sources (e.g. frozen frames of a wait) are copied into a free slot.
+
+    Attributes:
+        num_slots (int): Number of frames that can be in flight at once
+    """
+
+    num_slots = 4
+
+    def start_encoder(self):
+        shape = self.renderer.camera.pixel_array.shape
+        self.ring = FrameRing(shape, self.num_slots)
+        self.encoder_commands = multiprocessing.Queue()
+        self.free_slots = multiprocessing.Queue()
+        self.closed_files = multiprocessing.Queue()
+        for slot in range(self.num_slots):
+            self.free_slots.put(slot)
+
+        self.encoder = multiprocessing.Process(
+            target=run_encoder,
+            args=(
+                self.ring.shm.name,
+                shape,
+                self.num_slots,
+                self.encoder_commands,
+                self.free_slots,
+                self.closed_files,
+            ),
+            daemon=True,
+        )
+        self.encoder.start()
+
+    def wait_for_encoder(self, queue):
+        """
+        Blocks until the encoder puts something on the queue.
+        """
+        while True:
+            try:
+                return queue.get(timeout=1)
+            except Empty:
+                if not self.encoder.is_alive():
+                    raise RuntimeError("The frame encoder process died")
+
+    def acquire_slot(self):
+        return self.wait_for_encoder(self.free_slots)
+
+    def open_partial_movie_stream(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        if getattr(self, "ring", None) is None:
+            self.start_encoder()
+        self.queue = EncoderQueue(self)
+        self.encoder_commands.put(("open", str(file_path), config.frame_rate))
+
+    def close_partial_movie_stream(self):
+        self.encoder_commands.put(("close",))
+        # The combine step needs the file to be complete
+        self.wait_for_encoder(self.closed_files)
+        logger.info(
+            f"Animation {self.renderer.num_plays} : "
+            "Partial movie file written in %(path)s",
+            {"path": f"'{self.partial_movie_file_path}'"},
+        )
+
+    def finish(self):
+        if getattr(self, "ring", None) is not None:
+            self.encoder_commands.put(("stop",))
+            self.encoder.join()
+            self.ring.close(unlink=True)
+            self.ring = None
+        super().finish()
+
+
+class ThroughputFileWriterMixin:
+    """
+    SceneFileWriter mixin that reports how fast frames reach the encoder.
+
+    Time is counted from the start of each written animation until its
+    partial movie file is complete, so it covers rendering, frame transport
+    and encoding.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.throughput_frames = 0
+        self.throughput_bytes = 0
+        self.throughput_time = 0
+        super().__init__(*args, **kwargs)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self.animation_start = perf_counter()
+        super().begin_animation(allow_write, file_path)
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write)
+        if allow_write:
+            self.throughput_time += perf_counter() - self.animation_start
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        self.throughput_frames += num_frames
+        self.throughput_bytes += num_frames * frame_or_renderer.nbytes
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def finish(self):
+        super().finish()
+        if self.throughput_time:
+            logger.info(
+                "Frame throughput: %(frames)i frames in %(time).2fs, "
+                "%(fps).1f frames/s, %(mb).1f MB/s",
+                {
+                    "frames": self.throughput_frames,
+                    "time": self.throughput_time,
+                    "fps": self.throughput_frames / self.throughput_time,
+                    "mb": self.throughput_bytes / self.throughput_time / 1e6,
+                },
+            )
@@ -0,0 +1,169 @@
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from PIL import Image
+
+# Golden manifests are kept in the repository, next to src/
+GOLDEN_DIR = Path(__file__).parent.parent.parent / "golden"
+
+# Names of the scenes whose frames didn't match their golden manifest
+golden_failures = []
+
+
+def exact_hash(frame):
+    """
+    Returns the SHA-256 of the raw RGBA bytes of a frame.
+    """
+    return hashlib.sha256(np.ascontiguousarray(frame)).hexdigest()
+
+
+def perceptual_hash(frame):
+    """
+    Returns the 64-bit difference hash (dHash) of a frame as hex.
+
+    The frame is shrunk to 9x8 gray pixels and each bit says whether a pixel
+    is brighter than its left neighbour, so antialiasing and encoder-level
+    noise leave the hash (nearly) unchanged while moved or recolored
+    mobjects change it.
+    """
+    gray = np.asarray(frame[..., :3], dtype=np.float32) @ [0.299, 0.587, 0.114]
+    small = Image.fromarray(gray.astype(np.uint8)).resize((9, 8), Image.BOX)
+    pixels = np.asarray(small, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return f"{int(''.join('1' if bit else '0' for bit in bits), 2):016x}"
+
+
+def hamming_distance(hash_a, hash_b):
+    return (int(hash_a, 16) ^ int(hash_b, 16)).bit_count()
+
+
+class GoldenFrameFileWriterMixin:
+    """
+    SceneFileWriter mixin that hashes rendered frames into a golden manifest.
+
+    By default the end frame of every ``play`` is hashed, or every written
+    frame when ``golden_every_frame`` is set. Each hash is a SHA-256 of the
+    exact pixels plus a perceptual dHash. In "record" mode the hashes are
+    written to ``golden/<Scene>_<height>p<fps>.json``; in "compare" mode
+    they are checked against that manifest and differences are reported.
+
+    Attributes:
+        golden_mode (str): "record" or "compare"
+        golden_every_frame (bool): Hash every frame instead of play end frames
+        perceptual_tolerance (int): dHash bits that may differ in a match
+    """
+
+    golden_mode = "compare"
+    golden_every_frame = False
+    perceptual_tolerance = 4
+
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        self.golden_scene_name = scene_name
+        self.golden_hashes = []
+        self.golden_frame = 0
+        self.golden_last_frame = None
+
+    def add_golden_hash(self, frame):
+        self.golden_hashes.append(
+            {
+                "play": self.renderer.num_plays,
+                "frame": self.golden_frame,
+                "exact": exact_hash(frame),
+                "perceptual": perceptual_hash(frame),
+            }
+        )
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if self.golden_every_frame:
+            self.add_golden_hash(frame_or_renderer)
+        else:
+            self.golden_last_frame = frame_or_renderer
+        self.golden_frame += num_frames
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def end_animation(self, allow_write=False):
+        # The last frame isn't reused before the next play renders
+        if self.golden_last_frame is not None:
+            self.add_golden_hash(self.golden_last_frame)
+            self.golden_last_frame = None
+        super().end_animation(allow_write)
+
+    @property
+    def golden_manifest_path(self):
+        return GOLDEN_DIR / (
+            f"{self.golden_scene_name}_{config.pixel_height}p"
+            f"{config.frame_rate:g}.json"
+        )
+
+    def compare_golden_hashes(self, golden_hashes):
+        """
+        Compares this run's hashes with the golden ones.
+
+        Returns:
+            tuple: Counts of exact and perceptual matches, and the mismatches
+        """
+        exact = perceptual = 0
+        mismatches = []
+        for golden, current in zip(golden_hashes, self.golden_hashes):
+            distance = hamming_distance(golden["perceptual"], current["perceptual"])
+            if golden["exact"] == current["exact"]:
+                exact += 1
+            elif distance <= self.perceptual_tolerance:
+                perceptual += 1
+            else:
+                mismatches.append({**current, "distance": distance})
+        return exact, perceptual, mismatches
+
+    def finish(self):
+        super().finish()
+        if not self.golden_hashes:
+            # A run that hashed nothing must not pass as matching
+            logger.error(f"{self.golden_scene_name}: no frames were hashed")
+            if self.golden_mode == "compare":
+                golden_failures.append(self.golden_scene_name)
+            return
+
+        path = self.golden_manifest_path
+        if self.golden_mode == "record":
+            path.parent.mkdir(parents=True, exist_ok=True)
+            manifest = {
+                "scene": self.golden_scene_name,
+                "every_frame": self.golden_every_frame,
+                "hashes": self.golden_hashes,
+            }
+            path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+            logger.info(
+                "Golden manifest with %(count)i hashes written to %(path)s",
+                {"count": len(self.golden_hashes), "path": str(path)},
+            )
+            return
+
+        if not path.exists():
+            logger.error(f"No golden manifest at {path}, record one first")
+            golden_failures.append(self.golden_scene_name)
+            return
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest["every_frame"] != self.golden_every_frame:
+            logger.error(
+                f"{path} was recorded with every_frame={manifest['every_frame']}"
+            )
+            golden_failures.append(self.golden_scene_name)
+            return
+
+        exact, perceptual, mismatches = self.compare_golden_hashes(manifest["hashes"])
+        logger.info(
+            f"{self.golden_scene_name}: {exact} exact and {perceptual} perceptual "
+            f"matches, {len(mismatches)} mismatches "
+            f"({len(self.golden_hashes)} hashes, {len(manifest['hashes'])} golden)"
+        )
+        for mismatch in mismatches[:10]:
+            logger.error(
+                f"Play {mismatch['play']}, frame {mismatch['frame']} differs "
+                f"from the golden frame ({mismatch['distance']} dHash bits)"
+            )
+        if mismatches or len(manifest["hashes"]) != len(self.golden_hashes):
+            golden_failures.append(self.golden_scene_name)
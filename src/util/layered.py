@@ -0,0 +1,133 @@
+import numpy as np
+from manim import *
+
+
+class LayeredRendererMixin:
+    """
+    CairoRenderer mixin that rasterizes only what changes during a play.
+
+    manim redraws every mobject from the first moving one to the top of the
+    scene on every frame. Instead, when a play starts, the mobjects it draws
+    are split into runs of moving and static ones. Static runs at the bottom
+    are baked into the background, and every other static run is rasterized
+    once into a transparent layer. Each frame then draws only the moving
+    runs and composites the cached layers between them.
+
+    Layers are rebuilt for every play and dropped as soon as the camera
+    frame moves. Only VMobjects are layered; anything else is redrawn.
+    Edges of layered mobjects over moving ones may differ from a direct
+    rasterization by one step of rounding.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layered_plays = 0
+        self.layered_frames = 0
+
+    def camera_state(self):
+        return (
+            tuple(np.round(self.camera.frame_center, 6)),
+            round(float(self.camera.frame_width), 6),
+            round(float(self.camera.frame_height), 6),
+        )
+
+    def changing_mobjects(self, scene):
+        """
+        Returns the ids of mobjects animated or updated during the current play.
+        """
+        changing = set()
+        roots = [animation.mobject for animation in scene.animations]
+        roots += [mob for mob in scene.get_mobject_family_members() if mob.updaters]
+        for root in roots:
+            changing.update(id(mob) for mob in root.get_family())
+        return changing
+
+    def build_layers(self, scene):
+        """
+        Splits the moving mobjects of the current play into runs and caches
+        the static ones.
+        """
+        self.layers = None
+        moving_frame = getattr(self.camera, "frame", None)
+        if scene.updaters or not scene.moving_mobjects:
+            return
+        changing = self.changing_mobjects(scene)
+        if moving_frame is not None and id(moving_frame) in changing:
+            return
+
+        runs = []
+        for mob in self.camera.get_mobjects_to_display(scene.moving_mobjects):
+            static = isinstance(mob, VMobject) and id(mob) not in changing
+            if runs and runs[-1][0] == static:
+                runs[-1][1].append(mob)
+            else:
+                runs.append((static, [mob]))
+        if not any(static for static, _ in runs):
+            return
+
+        # Static mobjects below every moving one become part of the background
+        if runs[0][0]:
+            _, bottom = runs.pop(0)
+            self.update_frame(scene, bottom, include_submobjects=False)
+            self.static_image = self.get_frame()
+
+        canvas = self.camera.pixel_array
+        if getattr(self, "layer_canvas", None) is None:
+            self.layer_canvas = np.zeros_like(canvas)
+        # A plain Camera caches a canvas's context with the transform of the
+        # frame at the time, so draw the layers with the same one as the canvas
+        self.camera.get_cairo_context(self.layer_canvas).set_matrix(
+            self.camera.get_cairo_context(canvas).get_matrix()
+        )
+        self.camera.pixel_array = self.layer_canvas
+        self.layers = []
+        for static, mobjects in runs:
+            if not static:
+                self.layers.append(mobjects)
+                continue
+            self.layer_canvas.fill(0)
+            self.camera.capture_mobjects(mobjects, include_submobjects=False)
+            rows, cols = np.nonzero(self.layer_canvas[:, :, 3])
+            if not len(rows):
+                continue
+            region = np.s_[rows.min() : rows.max() + 1, cols.min() : cols.max() + 1]
+            # Cairo's pixels are premultiplied, so "over" is layer + (1 - a) * frame
+            layer = self.layer_canvas[region].astype(np.uint16)
+            self.layers.append((region, layer, 255 - layer[:, :, 3:]))
+        self.camera.pixel_array = canvas
+        self.layers_camera_state = self.camera_state()
+        self.layered_plays += 1
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        super().save_static_frame_data(scene, static_mobjects)
+        self.build_layers(scene)
+        return self.static_image
+
+    def update_frame(self, scene, mobjects=None, *args, **kwargs):
+        layers = getattr(self, "layers", None)
+        if layers is None or mobjects is not scene.moving_mobjects:
+            return super().update_frame(scene, mobjects, *args, **kwargs)
+        if self.camera_state() != self.layers_camera_state:
+            self.layers = None
+            return super().update_frame(scene, mobjects, *args, **kwargs)
+
+        if self.static_image is None:
+            self.camera.reset()
+        else:
+            self.camera.set_frame_to_background(self.static_image)
+        frame = self.camera.pixel_array
+        for layer in layers:
+            if isinstance(layer, list):
+                self.camera.capture_mobjects(layer, include_submobjects=False)
+            else:
+                region, pixels, transparency = layer
+                under = frame[region].astype(np.uint16)
+                frame[region] = pixels + (under * transparency + 127) // 255
+        self.layered_frames += 1
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        logger.info(
+            f"Layered rasterization: {self.layered_plays} plays and "
+            f"{self.layered_frames} frames drew only their moving mobjects"
+        )
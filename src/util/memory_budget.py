@@ -0,0 +1,258 @@
+import gc
+import mmap
+import resource
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+from manim import *
+from manim.mobject.svg import svg_mobject
+
+
+def current_rss():
+    """
+    Returns the resident set size of this process in bytes.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # No procfs (e.g. macOS): fall back to the peak, reported in bytes there
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def is_spilled(array):
+    while array is not None:
+        if isinstance(array, mmap.mmap):
+            return True
+        # np.frombuffer keeps the mmap behind a memoryview
+        array = getattr(array, "base", getattr(array, "obj", None))
+    return False
+
+
+def spill_to_disk(arrays, spill_dir=None):
+    """
+    Moves arrays into one memory-mapped temporary file.
+
+    The returned copies are backed by the file instead of anonymous memory,
+    and their pages are dropped from this process until they are read again.
+
+    Args:
+        arrays (list): The arrays to spill
+        spill_dir (str, optional): Directory of the temporary file
+
+    Returns:
+        list: File-backed copies of the arrays, in the same order
+    """
+    # Keep every array aligned to 16 bytes within the file
+    offsets = np.cumsum([0] + [-(-array.nbytes // 16) * 16 for array in arrays])
+    with tempfile.TemporaryFile(dir=spill_dir) as file:
+        file.truncate(max(int(offsets[-1]), 1))
+        spill = mmap.mmap(file.fileno(), 0)
+    copies = []
+    for array, offset in zip(arrays, offsets):
+        copy = np.frombuffer(
+            spill, dtype=array.dtype, count=array.size, offset=int(offset)
+        ).reshape(array.shape)
+        copy[...] = array
+        copies.append(copy)
+    spill.flush()
+    spill.madvise(mmap.MADV_DONTNEED)
+    return copies
+
+
+class LRUCache(OrderedDict):
+    """
+    Dict that remembers the order of lookups, so the oldest entries can be evicted.
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def evict(self, fraction=0.5):
+        """
+        Drops the least recently used entries.
+
+        Returns:
+            int: Number of entries dropped
+        """
+        count = int(len(self) * fraction) or len(self)
+        for _ in range(count):
+            self.popitem(last=False)
+        return count
+
+
+def retained_mobjects(scene):
+    """
+    Finds mobjects the scene keeps in attributes while they're off screen.
+    """
+    on_screen = {id(mob) for mob in scene.get_mobject_family_members()}
+    retained = {}
+    values = list(vars(scene).values())
+    while values:
+        value = values.pop()
+        if isinstance(value, Mobject):
+            for mob in value.get_family():
+                if id(mob) not in on_screen:
+                    retained[id(mob)] = mob
+        elif isinstance(value, (list, tuple, set)):
+            values.extend(value)
+        elif isinstance(value, dict):
+            values.extend(value.values())
+    return list(retained.values())
+
+
+class MemoryBudgetFileWriterMixin:
+    """
+    SceneFileWriter mixin that keeps the process under a memory budget.
+
+    Text and TeX share manim's in-memory SVG cache, which is replaced with an
+    LRU cache. When the RSS goes over the budget, frames queued for the
+    encoder are spilled to disk. Together with MemoryBudgetRendererMixin,
+    which evicts cache entries and spills off-screen point data, every
+    eviction is logged and a summary is reported when the scene finishes.
+
+    Attributes:
+        memory_budget (int): Maximum RSS in MB
+        spill_dir (str): Directory for spilled data (the system temp by default)
+    """
+
+    memory_budget = 2048
+    spill_dir = None
+
+    def __init__(self, *args, **kwargs):
+        self.memory_events = []
+        self.memory_peak = current_rss()
+        self.spilled_frames = 0
+        if not isinstance(svg_mobject.SVG_HASH_TO_MOB_MAP, LRUCache):
+            svg_mobject.SVG_HASH_TO_MOB_MAP = LRUCache(svg_mobject.SVG_HASH_TO_MOB_MAP)
+        super().__init__(*args, **kwargs)
+
+    def memory_over_budget(self):
+        rss = current_rss()
+        self.memory_peak = max(self.memory_peak, rss)
+        return rss > self.memory_budget * 2**20
+
+    def report_eviction(self, kind, count, rss_before):
+        rss = current_rss()
+        self.memory_events.append(
+            {
+                "play": self.renderer.num_plays,
+                "kind": kind,
+                "count": count,
+                "rss_before": rss_before,
+                "rss_after": rss,
+            }
+        )
+        logger.info(
+            f"Memory budget: {kind} ({count}) during play {self.renderer.num_plays}, "
+            f"RSS {rss_before / 2**20:.0f} MB -> {rss / 2**20:.0f} MB "
+            f"(budget {self.memory_budget} MB)"
+        )
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        # Frames wait in a queue until the encoder thread takes them
+        if write_to_movie() and self.memory_over_budget():
+            (frame_or_renderer,) = spill_to_disk([frame_or_renderer], self.spill_dir)
+            self.spilled_frames += 1
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write)
+        if self.spilled_frames:
+            self.report_eviction(
+                "spilled queued frames to disk", self.spilled_frames, current_rss()
+            )
+            self.spilled_frames = 0
+
+    def finish(self):
+        super().finish()
+        self.memory_over_budget()
+        kinds = {}
+        for event in self.memory_events:
+            kinds[event["kind"]] = kinds.get(event["kind"], 0) + event["count"]
+        logger.info(
+            f"Memory budget {self.memory_budget} MB: peak RSS "
+            f"{self.memory_peak / 2**20:.0f} MB, "
+            + (
+                ", ".join(f"{kind}: {count}" for kind, count in kinds.items())
+                or "nothing evicted"
+            )
+        )
+
+
+class MemoryBudgetRendererMixin:
+    """
+    CairoRenderer mixin that enforces the file writer's memory budget between
+    frames and plays.
+
+    Each step runs only while the RSS is still over the budget: collect
+    garbage, evict the least recently used half of the Text/TeX cache, then
+    spill the points of mobjects the scene keeps off screen to disk.
+    """
+
+    # Growth in RSS, in bytes, before an enforcement that didn't get under the
+    # budget is tried again
+    memory_retry_growth = 64 * 2**20
+
+    def enforce_memory_budget(self, scene):
+        file_writer = self.file_writer
+        if not file_writer.memory_over_budget():
+            return
+        rss = current_rss()
+        failed_rss = getattr(self, "memory_failed_rss", None)
+        if failed_rss is not None and rss < failed_rss + self.memory_retry_growth:
+            return
+        if self.free_memory(scene, rss):
+            self.memory_failed_rss = None
+        else:
+            self.memory_failed_rss = current_rss()
+
+    def free_memory(self, scene, rss):
+        """
+        Runs the enforcement steps until the RSS is under the budget.
+
+        Returns:
+            bool: Whether the RSS got under the budget
+        """
+        file_writer = self.file_writer
+        freed = gc.collect()
+        file_writer.report_eviction("collected garbage", freed, rss)
+        if not file_writer.memory_over_budget():
+            return True
+
+        cache = svg_mobject.SVG_HASH_TO_MOB_MAP
+        if cache:
+            rss = current_rss()
+            evicted = cache.evict()
+            gc.collect()
+            file_writer.report_eviction("evicted Text/TeX cache entries", evicted, rss)
+            if not file_writer.memory_over_budget():
+                return True
+
+        spillable = [
+            mob
+            for mob in retained_mobjects(scene)
+            if mob.points.size and not is_spilled(mob.points)
+        ]
+        if spillable:
+            rss = current_rss()
+            spilled = spill_to_disk(
+                [mob.points for mob in spillable], file_writer.spill_dir
+            )
+            for mob, points in zip(spillable, spilled):
+                mob.points = points
+            file_writer.report_eviction(
+                "spilled off-screen points to disk", len(spillable), rss
+            )
+        return not file_writer.memory_over_budget()
+
+    def play(self, scene, *args, **kwargs):
+        self.enforce_memory_budget(scene)
+        super().play(scene, *args, **kwargs)
+
+    def render(self, scene, time, moving_mobjects):
+        super().render(scene, time, moving_mobjects)
+        self.enforce_memory_budget(scene)
@@ -0,0 +1,26 @@
+from manim import *
+
+# Semantic colors used by the scenes in 2pc.py
+DEFAULT_PALETTE = {
+    "highlight": YELLOW,
+    "transfer": YELLOW_C,
+    "accept": GREEN,
+    "reject": RED,
+}
+
+# Named themes that a variant table can refer to
+PALETTES = {
+    "default": DEFAULT_PALETTE,
+    "colorblind": {
+        "highlight": YELLOW,
+        "transfer": TEAL_C,
+        "accept": BLUE,
+        "reject": ORANGE,
+    },
+    "print": {
+        "highlight": GOLD_E,
+        "transfer": GRAY_B,
+        "accept": GREEN_E,
+        "reject": MAROON_E,
+    },
+}
@@ -0,0 +1,209 @@
+import ast
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import manim
+from manim import *
+
+# Files whose scenes and helpers build the assets
+SOURCE_FILES = [
+    Path(__file__).parent.parent / "2pc.py",
+    Path(__file__).parent / "intro.py",
+]
+
+# Mobjects backed by an on-disk cache (Pango and LaTeX output)
+CACHED_ASSETS = ("Text", "Tex", "MathTex")
+
+
+def call_name(node):
+    """
+    Returns the name a call is made through: "f" for f(...) and self.f(...).
+    """
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def collect_functions(scene_cls):
+    """
+    Collects the methods of a scene and the module-level helpers it can call.
+    """
+    functions = {}
+    for source_file in SOURCE_FILES:
+        tree = ast.parse(source_file.read_text(encoding="utf-8"))
+        class_names = {cls.__name__ for cls in scene_cls.__mro__}
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef):
+                functions[node.name] = node
+            elif isinstance(node, ast.ClassDef) and node.name in class_names:
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef):
+                        functions[item.name] = item
+    return functions
+
+
+def collect_constants(functions):
+    """
+    Collects local and ``self.`` assignments of literals, e.g. font sizes.
+    """
+    local_constants = {}
+    self_constants = {}
+    for function in functions.values():
+        for node in ast.walk(function):
+            if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+                continue
+            if not isinstance(node.value, ast.Constant):
+                continue
+            target = node.targets[0]
+            if isinstance(target, ast.Name):
+                local_constants[target.id] = node.value.value
+            elif isinstance(target, ast.Attribute) and isinstance(
+                target.value, ast.Name
+            ):
+                self_constants[target.attr] = node.value.value
+    return local_constants, self_constants
+
+
+def call_bindings(functions, function):
+    """
+    Finds every call to a function and maps its parameters to the argument
+    expressions, so arguments flowing into an asset can be resolved.
+    """
+    params = [arg.arg for arg in function.args.args]
+    defaults = dict(
+        zip(params[len(params) - len(function.args.defaults) :], function.args.defaults)
+    )
+    bindings = []
+    for caller in functions.values():
+        for node in ast.walk(caller):
+            if not isinstance(node, ast.Call) or call_name(node) != function.name:
+                continue
+            # Methods are called as self.f(a), helpers as f(self, a)
+            bound_params = (
+                params[1:] if isinstance(node.func, ast.Attribute) else params
+            )
+            binding = {name: default for name, default in defaults.items()}
+            binding.update(zip(bound_params, node.args))
+            binding.update({kw.arg: kw.value for kw in node.keywords if kw.arg})
+            bindings.append(binding)
+    return bindings or [{}]
+
+
+def discover_assets(scene_cls):
+    """
+    Statically discovers the assets a scene builds.
+
+    Arguments are evaluated symbolically against the scene class, so titles,
+    party names and palette colors of a variant resolve to that variant's
+    values. Arguments that only exist at render time are skipped.
+
+    Args:
+        scene_cls (type): The scene class to inspect
+
+    Returns:
+        tuple: A list of ``(name, args, kwargs)`` of Text, Tex and MathTex
+        calls, a set of fontawesome icon names and a set of image paths
+    """
+    functions = collect_functions(scene_cls)
+    local_constants, self_constants = collect_constants(functions)
+    scene_self = type(scene_cls.__name__, (scene_cls,), self_constants)
+    env = {**vars(manim), **local_constants, "self": scene_self}
+
+    assets = {}
+    icons = set()
+    images = set()
+    for function in functions.values():
+        for binding in call_bindings(functions, function):
+            scope = dict(env)
+            for name, expr in binding.items():
+                try:
+                    scope[name] = eval(ast.unparse(expr), scope)
+                except Exception:
+                    pass
+
+            for node in ast.walk(function):
+                if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+                    if node.value.id in ("solid", "regular", "brands"):
+                        icons.add(f"{node.value.id}.{node.attr}")
+                if not isinstance(node, ast.Call):
+                    continue
+                name = call_name(node)
+                if name not in CACHED_ASSETS and name != "ImageMobject":
+                    continue
+                try:
+                    args = [eval(ast.unparse(arg), scope) for arg in node.args]
+                    kwargs = {
+                        kw.arg: eval(ast.unparse(kw.value), scope)
+                        for kw in node.keywords
+                        if kw.arg
+                    }
+                except Exception:
+                    continue
+                if name == "ImageMobject":
+                    images.add(args[0])
+                elif all(isinstance(arg, str) for arg in args):
+                    assets[repr((name, args, sorted(kwargs.items())))] = (
+                        name,
+                        args,
+                        kwargs,
+                    )
+    return list(assets.values()), icons, images
+
+
+def build_asset(name, args, kwargs):
+    """
+    Builds one asset in a worker process, filling the on-disk SVG cache.
+    """
+    getattr(manim, name)(*args, **kwargs)
+    return name
+
+
+def preflight(*scene_classes, max_workers=None):
+    """
+    Builds every asset the given scenes will need before they render.
+
+    Text and TeX are built concurrently in a process pool, so Pango layout and
+    LaTeX runs happen there and construct() finds their SVGs in the cache.
+    Icons are loaded in this process, and image paths are checked to exist.
+
+    Args:
+        *scene_classes (type): The scene classes to warm up for
+        max_workers (int, optional): Size of the process pool
+
+    Returns:
+        float: Seconds spent warming up
+    """
+    start = time.perf_counter()
+    assets = {}
+    icons = set()
+    images = set()
+    for scene_cls in scene_classes:
+        scene_assets, scene_icons, scene_images = discover_assets(scene_cls)
+        assets.update({repr(asset): asset for asset in scene_assets})
+        icons |= scene_icons
+        images |= scene_images
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(build_asset, *asset) for asset in assets.values()]
+
+        # Icons are cached in memory, so they are loaded in this process
+        for icon in icons:
+            style, name = icon.split(".")
+            package = __import__("manim_fontawesome", fromlist=[style])
+            getattr(getattr(package, style), name)
+        for image in images:
+            if not Path(image).exists():
+                raise FileNotFoundError(f"Missing image {image}")
+
+        for future in futures:
+            future.result()
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"Pre-flight: {len(assets)} text/TeX assets, {len(icons)} icons and "
+        f"{len(images)} images warmed up in {elapsed:.2f}s"
+    )
+    return elapsed
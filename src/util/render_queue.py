@@ -0,0 +1,254 @@
+import asyncio
+import itertools
+import os
+import sys
+import time
+from pathlib import Path
+
+from manim import *
+
+# Every job renders through the render.py CLI in its own process
+RENDER_SCRIPT = Path(__file__).parent.parent / "render.py"
+
+
+class RenderJob:
+    """
+    One render request.
+
+    Args:
+        job_id (int): Number of the job, in order of submission
+        scene (str): Name of the scene class in src/2pc.py
+        quality (str, optional): Render quality (defaults to the one in manim.cfg)
+        animations (str, optional): Range of animations to render, as for
+            ``render.py -n``, e.g. "3,7"
+        priority (int): Jobs with lower numbers run first
+    """
+
+    def __init__(self, job_id, scene, quality=None, animations=None, priority=0):
+        self.job_id = job_id
+        self.scene = scene
+        self.quality = quality
+        self.animations = animations
+        self.priority = priority
+        self.state = "pending"
+        self.process = None
+        self.started = None
+        self.done = asyncio.Event()
+        # Set once a killed job's partial movie files are removed
+        self.cleaned_up = asyncio.Event()
+        # Killed jobs of the same scene that must be cleaned up before this runs
+        self.superseded_jobs = []
+
+    @property
+    def key(self):
+        return (self.scene, self.quality, self.animations)
+
+    def command(self):
+        command = [sys.executable, str(RENDER_SCRIPT), self.scene]
+        if self.quality:
+            command += ["-q", self.quality]
+        if self.animations:
+            command += ["-n", self.animations]
+        return command
+
+    def __repr__(self):
+        options = ", ".join(str(option) for option in self.key[1:] if option)
+        return f"#{self.job_id} {self.scene}" + (f" ({options})" if options else "")
+
+
+class RenderQueue:
+    """
+    Priority queue of render jobs, run by a pool of worker processes.
+
+    Each worker takes the most urgent pending job and renders it in a
+    render.py subprocess, so running jobs can be killed. A new request for
+    a scene supersedes the scene's older jobs: pending ones are dropped and
+    a running one is killed. A request identical to one that is still
+    pending is merged into it instead.
+
+    Args:
+        num_workers (int, optional): Number of concurrent renders (CPU count by default)
+        log_dir (str, optional): Directory for the output of each job
+    """
+
+    def __init__(self, num_workers=None, log_dir=None):
+        self.num_workers = num_workers or os.cpu_count()
+        self.log_dir = Path(log_dir or Path(config.media_dir) / "render_queue")
+        self.pending = asyncio.PriorityQueue()
+        self.active_jobs = {}
+        self.job_ids = itertools.count(1)
+        self.sequence = itertools.count()
+        self.workers = []
+        self.worker_jobs = [None] * self.num_workers
+        self.worker_busy_since = [None] * self.num_workers
+        self.worker_busy_time = [0.0] * self.num_workers
+        self.started = time.monotonic()
+        self.counts = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "superseded": 0,
+            "finished": 0,
+            "failed": 0,
+        }
+
+    def start(self):
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = [
+            asyncio.create_task(self.worker(index)) for index in range(self.num_workers)
+        ]
+
+    async def stop(self):
+        running = [job for job in self.worker_jobs if job is not None]
+        for job in list(itertools.chain(*self.active_jobs.values())):
+            self.cancel(job)
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        for job in running:
+            self.clean_up_partial_movies(job)
+
+    def submit(self, scene, quality=None, animations=None, priority=0):
+        """
+        Adds a render request, deduplicating it or superseding older jobs.
+
+        Returns:
+            RenderJob: The job that will render the request
+        """
+        self.counts["submitted"] += 1
+        jobs = self.active_jobs.setdefault(scene, [])
+        for job in jobs:
+            if job.state == "pending" and job.key == (scene, quality, animations):
+                self.counts["deduplicated"] += 1
+                if priority < job.priority:
+                    # The old heap entry is skipped once the job has run
+                    job.priority = priority
+                    self.pending.put_nowait((priority, next(self.sequence), job))
+                logger.info(f"Render queue: {job} already pending")
+                return job
+
+        # A cancelled pending job may still be waiting on older jobs' clean-up
+        superseded_jobs = []
+        for job in jobs:
+            if job.state == "running":
+                superseded_jobs.append(job)
+            else:
+                superseded_jobs += job.superseded_jobs
+        for job in list(jobs):
+            self.counts["superseded"] += 1
+            logger.info(f"Render queue: {job} superseded")
+            self.cancel(job)
+
+        job = RenderJob(next(self.job_ids), scene, quality, animations, priority)
+        job.superseded_jobs = superseded_jobs
+        jobs.append(job)
+        self.pending.put_nowait((priority, next(self.sequence), job))
+        logger.info(f"Render queue: {job} queued with priority {priority}")
+        return job
+
+    def cancel(self, job):
+        if job.state == "running" and job.process and job.process.returncode is None:
+            job.process.kill()
+        if job.state in ("pending", "running"):
+            self.finish_job(job, "cancelled")
+
+    def finish_job(self, job, state):
+        job.state = state
+        self.active_jobs[job.scene].remove(job)
+        job.done.set()
+
+    def clean_up_partial_movies(self, job):
+        """
+        Removes the partial movie files a killed job may have left half written,
+        since they are named like complete ones and would be reused as cached.
+        """
+        with tempconfig({"quality": job.quality} if job.quality else {}):
+            partial_movie_dir = Path(
+                config.get_dir(
+                    "partial_movie_dir",
+                    module_name=Path(config.input_file).stem,
+                    scene_name=job.scene,
+                )
+            )
+        if partial_movie_dir.exists():
+            for path in partial_movie_dir.iterdir():
+                if path.stat().st_mtime >= job.started:
+                    path.unlink()
+
+    async def worker(self, index):
+        while True:
+            _, _, job = await self.pending.get()
+            if job.state != "pending":
+                continue
+            # Don't let a killed job's clean-up delete this job's files
+            for superseded_job in job.superseded_jobs:
+                await superseded_job.cleaned_up.wait()
+            if job.state != "pending":
+                continue
+
+            job.state = "running"
+            job.started = time.time()
+            self.worker_jobs[index] = job
+            self.worker_busy_since[index] = time.monotonic()
+            log_path = self.log_dir / f"{job.job_id}_{job.scene}.log"
+            logger.info(f"Render queue: {job} started on worker {index}")
+            try:
+                with open(log_path, "wb") as log:
+                    job.process = await asyncio.create_subprocess_exec(
+                        *job.command(), stdout=log, stderr=asyncio.subprocess.STDOUT
+                    )
+                    # The job may have been superseded while the process started
+                    if job.state == "cancelled":
+                        job.process.kill()
+                    returncode = await job.process.wait()
+            finally:
+                self.worker_busy_time[index] += (
+                    time.monotonic() - self.worker_busy_since[index]
+                )
+                self.worker_jobs[index] = None
+                self.worker_busy_since[index] = None
+
+            if job.state == "cancelled":
+                try:
+                    self.clean_up_partial_movies(job)
+                except OSError as error:
+                    logger.error(
+                        f"Render queue: cleaning up after {job} failed: {error}"
+                    )
+                job.cleaned_up.set()
+                continue
+            state = "finished" if returncode == 0 else "failed"
+            self.counts[state] += 1
+            self.finish_job(job, state)
+            logger.info(
+                f"Render queue: {job} {state} in "
+                f"{time.time() - job.started:.1f}s (log in {log_path})"
+            )
+
+    def metrics(self):
+        """
+        Returns a snapshot of the queue depth, job counts and worker usage.
+
+        A worker's utilization is the fraction of the queue's lifetime it spent
+        running jobs.
+        """
+        now = time.monotonic()
+        uptime = max(now - self.started, 1e-9)
+        active = list(itertools.chain(*self.active_jobs.values()))
+        workers = []
+        for job, busy_time, busy_since in zip(
+            self.worker_jobs, self.worker_busy_time, self.worker_busy_since
+        ):
+            if busy_since is not None:
+                busy_time += now - busy_since
+            workers.append(
+                {
+                    "job": repr(job) if job else None,
+                    "utilization": round(busy_time / uptime, 3),
+                }
+            )
+        return {
+            "queue_depth": sum(job.state == "pending" for job in active),
+            "running": sum(job.state == "running" for job in active),
+            **self.counts,
+            "workers": workers,
+        }
@@ -0,0 +1,36 @@
+from manim import *
+
+
+def build_scene(
+    scene_cls,
+    file_writer_mixins=(),
+    renderer_mixins=(),
+    **writer_options,
+):
+    """
+    Instantiates a scene whose renderer uses extended file writer and renderer classes.
+
+    Each render mode of render.py is a mixin for SceneFileWriter or
+    CairoRenderer, so modes can be combined freely.
+
+    Args:
+        scene_cls (type): The scene class to instantiate
+        file_writer_mixins (tuple): Mixins to put in front of SceneFileWriter
+        renderer_mixins (tuple): Mixins to put in front of CairoRenderer
+        **writer_options: Class attributes set on the combined file writer class
+    """
+    if not (file_writer_mixins or renderer_mixins):
+        return scene_cls()
+
+    camera_class = MovingCamera if issubclass(scene_cls, MovingCameraScene) else Camera
+    file_writer_class = type(
+        SceneFileWriter.__name__,
+        (*file_writer_mixins, SceneFileWriter),
+        writer_options,
+    )
+
+    renderer_class = type(CairoRenderer.__name__, (*renderer_mixins, CairoRenderer), {})
+    renderer = renderer_class(
+        file_writer_class=file_writer_class, camera_class=camera_class
+    )
+    return scene_cls(renderer=renderer)
@@ -0,0 +1,199 @@
+from queue import Queue
+from threading import Thread
+
+import av
+from manim import *
+from manim.scene.scene_file_writer import to_av_frame_rate
+
+# Minimal player for the HLS output. Browsers without native HLS (Firefox,
+# desktop Chrome) load hls.js from a CDN, so they need network access.
+PLAYER_HTML = """<!DOCTYPE html>
+<html>
+  <head>
+    <meta charset="utf-8" />
+    <title>{title}</title>
+    <script src="https://cdn.jsdelivr.net/npm/hls.js@1"></script>
+  </head>
+  <body style="margin: 0; background: black">
+    <video id="video" controls autoplay muted style="width: 100%"></video>
+    <script>
+      const video = document.getElementById("video");
+      if (video.canPlayType("application/vnd.apple.mpegurl")) {{
+        video.src = "playlist.m3u8";
+      }} else {{
+        const hls = new Hls();
+        hls.loadSource("playlist.m3u8");
+        hls.attachMedia(video);
+      }}
+    </script>
+  </body>
+</html>
+"""
+
+
+class StreamingFileWriterMixin:
+    """
+    SceneFileWriter mixin that writes the scene as an HLS stream while it renders.
+
+    Frames are encoded into fixed-length fragmented MP4 segments, and the
+    playlist is updated after every segment, so the scene can be watched
+    while later animations are still rendering. The stream is written to
+    ``<video dir>/<scene name>_hls`` together with an ``index.html`` player.
+    Safari plays the stream offline; other browsers fetch hls.js from jsDelivr.
+
+    Attributes:
+        segment_duration (float): Length of each segment in seconds
+        stream_only (bool): Skip partial movie files and the final combine step
+    """
+
+    segment_duration = 2
+    stream_only = False
+
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        self.stream_container = None
+        if write_to_movie() and not config.dry_run:
+            self.stream_dir = guarantee_existence(
+                self.movie_file_path.parent / f"{self.output_name}_hls"
+            )
+
+    def open_stream(self):
+        """
+        Opens the HLS playlist and starts the thread encoding frames into it.
+        """
+        fps = to_av_frame_rate(config.frame_rate)
+        # One keyframe per segment, so every segment is exactly segment_duration long
+        gop_size = str(round(config.frame_rate * self.segment_duration))
+
+        self.stream_container = av.open(
+            str(self.stream_dir / "playlist.m3u8"),
+            mode="w",
+            format="hls",
+            options={
+                "hls_time": str(self.segment_duration),
+                "hls_playlist_type": "event",
+                "hls_segment_type": "fmp4",
+            },
+        )
+        stream = self.stream_container.add_stream(
+            "libx264",
+            rate=fps,
+            options={
+                "crf": "23",
+                "g": gop_size,
+                "keyint_min": gop_size,
+                "sc_threshold": "0",
+            },
+        )
+        stream.pix_fmt = "yuv420p"
+        stream.width = config.pixel_width
+        stream.height = config.pixel_height
+        self.stream = stream
+        self.stream_frame_count = 0
+
+        (self.stream_dir / "index.html").write_text(
+            PLAYER_HTML.format(title=self.output_name), encoding="utf-8"
+        )
+        logger.info(
+            "Streaming to %(path)s, serve it with `python -m http.server -d %(path)s`",
+            {"path": str(self.stream_dir)},
+        )
+
+        self.stream_queue = Queue()
+        self.stream_thread = Thread(target=self.listen_and_stream, args=())
+        self.stream_thread.start()
+
+    def listen_and_stream(self):
+        """For internal use only: blocks until new frame is available on the queue."""
+        while True:
+            num_frames, frame = self.stream_queue.get()
+            if frame is None:
+                break
+
+            for _ in range(num_frames):
+                av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+                av_frame.pts = self.stream_frame_count
+                self.stream_frame_count += 1
+                for packet in self.stream.encode(av_frame):
+                    self.stream_container.mux(packet)
+
+    def stream_frame(self, frame, num_frames=1):
+        if self.stream_container is None:
+            self.open_stream()
+        self.stream_queue.put((num_frames, frame))
+
+    def close_stream(self):
+        """
+        Flushes the encoder and closes the playlist, marking the stream as complete.
+        """
+        if self.stream_container is None:
+            return
+        self.stream_queue.put((-1, None))
+        self.stream_thread.join()
+
+        for packet in self.stream.encode():
+            self.stream_container.mux(packet)
+        self.stream_container.close()
+        self.stream_container = None
+
+        logger.info(
+            "Stream complete: %(frames)i frames written to %(path)s",
+            {"frames": self.stream_frame_count, "path": str(self.stream_dir)},
+        )
+
+    def stream_cached_partial_movie(self, file_path):
+        """
+        Feeds the frames of a cached partial movie file into the stream.
+        """
+        with av.open(file_path) as container:
+            for frame in container.decode(video=0):
+                self.stream_frame(frame.to_ndarray(format="rgba"))
+
+    def is_already_cached(self, hash_invocation):
+        # Without partial movie files every animation has to be rendered
+        if self.stream_only:
+            return False
+        return super().is_already_cached(hash_invocation)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if (
+            not self.stream_only
+            and write_to_movie()
+            and not allow_write
+            and self.partial_movie_files
+        ):
+            # The renderer skips animations whose partial movie file is cached.
+            # Animations skipped for other reasons have no file.
+            cached_file = self.partial_movie_files[-1]
+            if cached_file is not None:
+                self.stream_cached_partial_movie(cached_file)
+        super().begin_animation(allow_write, file_path)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        # Without partial movies the base writer's queue is the stream's own
+        if write_to_movie() and not self.stream_only:
+            self.stream_frame(frame_or_renderer, num_frames)
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def open_partial_movie_stream(self, file_path=None):
+        if not self.stream_only:
+            return super().open_partial_movie_stream(file_path)
+        if self.stream_container is None:
+            self.open_stream()
+        self.queue = self.stream_queue
+
+    def close_partial_movie_stream(self):
+        if not self.stream_only:
+            super().close_partial_movie_stream()
+
+    def combine_to_movie(self):
+        if not self.stream_only:
+            super().combine_to_movie()
+
+    def combine_to_section_videos(self):
+        if not self.stream_only:
+            super().combine_to_section_videos()
+
+    def finish(self):
+        self.close_stream()
+        super().finish()
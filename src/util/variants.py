@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+
+from manim import *
+
+from util.palette import PALETTES
+from util.renderer import build_scene
+
+# Scene class attributes a variant is allowed to override
+VARIANT_PARAMETERS = ("title_text", "intro_text", "party_names", "palette")
+
+# Example variant table. Every row needs a unique "name"; any other key
+# overrides the scene parameter of the same name.
+VARIANTS = [
+    {"name": "default"},
+    {"name": "colorblind", "palette": "colorblind"},
+    {"name": "generic", "party_names": ["Party A", "Party B"]},
+]
+
+
+def load_variants(path):
+    """
+    Loads a variant table from a JSON file holding a list of rows.
+
+    Args:
+        path (str): Path to the JSON file
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_variant(scene_cls, variant):
+    """
+    Creates a subclass of a scene with the parameters of one variant applied.
+
+    Args:
+        scene_cls (type): The scene class to derive the variant from
+        variant (dict): One row of a variant table
+    """
+    overrides = {key: value for key, value in variant.items() if key != "name"}
+    unknown = set(overrides) - set(VARIANT_PARAMETERS)
+    if unknown:
+        raise ValueError(
+            f"Variant '{variant['name']}' has unknown parameters: {sorted(unknown)}"
+        )
+
+    if "party_names" in overrides:
+        overrides["party_names"] = tuple(overrides["party_names"])
+    if "palette" in overrides:
+        palette = overrides["palette"]
+        if isinstance(palette, str):
+            palette = PALETTES[palette]
+        # Partial palettes only replace the colors they name
+        overrides["palette"] = {**scene_cls.palette, **palette}
+
+    return type(f"{scene_cls.__name__}_{variant['name']}", (scene_cls,), overrides)
+
+
+def render_variants(scene_cls, variants, **build_options):
+    """
+    Renders every variant of a scene, rendering shared segments only once.
+
+    Manim names each partial movie file after a hash of the camera, the
+    animations and the mobjects on screen. All variants write into one shared
+    partial movie directory, so a segment that no parameter touches (e.g. the
+    displayLogo intro) hashes the same in every variant and is rendered once;
+    only the segments that differ are recomputed.
+
+    Args:
+        scene_cls (type): The scene class to render
+        variants (list): Rows of the variant table
+        **build_options: Render mode options passed on to build_scene
+
+    Returns:
+        dict: Variant name to a (rendered, reused) count of segments
+    """
+    if config.disable_caching:
+        logger.warning("Caching is disabled, variants cannot share segments")
+
+    report = {}
+    with tempconfig(
+        {
+            "partial_movie_dir": "{video_dir}/partial_movie_files/shared",
+            # Keep the segments of every variant around until all are rendered
+            "max_files_cached": config.max_files_cached * len(variants),
+        }
+    ):
+        for variant in variants:
+            scene = build_scene(make_variant(scene_cls, variant), **build_options)
+            file_writer = scene.renderer.file_writer
+            cached = set()
+            if hasattr(file_writer, "partial_movie_directory"):
+                partial_movie_dir = Path(file_writer.partial_movie_directory)
+                cached = {path.stem for path in partial_movie_dir.iterdir()}
+
+            scene.render()
+
+            hashes = [h for h in scene.renderer.animations_hashes if h is not None]
+            reused = sum(h in cached for h in hashes)
+            report[variant["name"]] = (len(hashes) - reused, reused)
+            logger.info(
+                f"Variant {variant['name']}: rendered {len(hashes) - reused} "
+                f"segments, reused {reused}"
+            )
+    return report
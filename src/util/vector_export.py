@@ -0,0 +1,421 @@
+import base64
+import io
+import json
+
+import numpy as np
+from manim import *
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.utils.family import extract_mobject_family_members
+from PIL import Image
+
+# Standalone player for the exported timeline, drawing it on a canvas
+PLAYER_HTML = """<!DOCTYPE html>
+<html>
+  <head>
+    <meta charset="utf-8" />
+    <title>{title}</title>
+  </head>
+  <body style="margin: 0; background: black">
+    <canvas id="canvas" style="width: 100%"></canvas>
+    <script>
+      // Splits "M x y C x1 y1 x2 y2 x y ... Z" into subpaths of cubic curves
+      function parsePath(d) {{
+        const subpaths = [];
+        for (const [, command, args] of d.matchAll(/([MCZ])([^MCZ]*)/g)) {{
+          const numbers = args.trim().split(" ").filter(Boolean).map(Number);
+          if (command === "M") {{
+            subpaths.push({{ start: numbers, curves: [], closed: false }});
+          }} else if (command === "C") {{
+            subpaths[subpaths.length - 1].curves.push(numbers);
+          }} else {{
+            subpaths[subpaths.length - 1].closed = true;
+          }}
+        }}
+        return subpaths;
+      }}
+
+      // Draws the first `drawn` of the curves, split like manim's
+      // pointwise_become_partial, scaled to the mobject's size
+      function buildPath(subpaths, drawn, sx, sy) {{
+        const path = new Path2D();
+        const total = subpaths.reduce((n, subpath) => n + subpath.curves.length, 0);
+        let remaining = drawn * total;
+        for (const {{ start, curves, closed }} of subpaths) {{
+          let [x, y] = start;
+          path.moveTo(x * sx, y * sy);
+          for (const [x1, y1, x2, y2, x3, y3] of curves) {{
+            if (remaining < 1) {{
+              // De Casteljau split of the curve at t = remaining
+              const t = remaining;
+              const lerp = (a, b) => a + (b - a) * t;
+              const [ax, ay] = [lerp(x, x1), lerp(y, y1)];
+              const [bx, by] = [lerp(x1, x2), lerp(y1, y2)];
+              const [cx, cy] = [lerp(ax, bx), lerp(ay, by)];
+              const [dx, dy] = [lerp(bx, lerp(x2, x3)), lerp(by, lerp(y2, y3))];
+              const [ex, ey] = [lerp(cx, dx), lerp(cy, dy)];
+              path.bezierCurveTo(ax * sx, ay * sy, cx * sx, cy * sy, ex * sx, ey * sy);
+              return path;
+            }}
+            path.bezierCurveTo(x1 * sx, y1 * sy, x2 * sx, y2 * sy, x3 * sx, y3 * sy);
+            [x, y] = [x3, y3];
+            remaining -= 1;
+          }}
+          if (closed) path.closePath();
+        }}
+        return path;
+      }}
+
+      fetch("{timeline}").then((r) => r.json()).then((timeline) => {{
+        const canvas = document.getElementById("canvas");
+        const ctx = canvas.getContext("2d");
+        canvas.width = timeline.width;
+        canvas.height = timeline.height;
+        // Paths are in units of half the mobject's width and height
+        const paths = Object.fromEntries(
+          Object.entries(timeline.paths).map(([id, d]) => [id, parsePath(d)])
+        );
+        const images = Object.fromEntries(
+          Object.entries(timeline.images).map(([id, src]) => {{
+            const image = new Image();
+            image.src = src;
+            return [id, image];
+          }})
+        );
+        const rgba = (hex, opacity) =>
+          hex + Math.round(opacity * 255).toString(16).padStart(2, "0");
+
+        // Replay every layer's keyframes up to a frame, then draw the layers
+        function draw(frame) {{
+          let camera = {{}};
+          for (const key of timeline.camera) {{
+            if (key.f > frame) break;
+            Object.assign(camera, key);
+          }}
+          const visible = [];
+          for (const layer of timeline.layers) {{
+            const state = {{}};
+            for (const key of layer.keyframes) {{
+              if (key.f > frame) break;
+              Object.assign(state, key);
+            }}
+            if (state.z !== undefined && !state.hidden) visible.push(state);
+          }}
+          visible.sort((a, b) => a.z - b.z);
+
+          const scale = timeline.width / camera.w;
+          ctx.setTransform(1, 0, 0, 1, 0, 0);
+          ctx.fillStyle = timeline.background;
+          ctx.fillRect(0, 0, canvas.width, canvas.height);
+          for (const state of visible) {{
+            ctx.setTransform(
+              scale, 0, 0, -scale,
+              timeline.width / 2 + (state.x - camera.x) * scale,
+              timeline.height / 2 - (state.y - camera.y) * scale
+            );
+            if (state.image) {{
+              ctx.globalAlpha = state.o;
+              ctx.scale(1, -1);
+              ctx.drawImage(
+                images[state.image], -state.w / 2, -state.h / 2, state.w, state.h
+              );
+              ctx.globalAlpha = 1;
+              continue;
+            }}
+            const path = buildPath(paths[state.path], state.b, state.sx, state.sy);
+            if (state.fo > 0) {{
+              ctx.fillStyle = rgba(state.fill, state.fo);
+              ctx.fill(path);
+            }}
+            if (state.so > 0 && state.sw > 0) {{
+              ctx.strokeStyle = rgba(state.stroke, state.so);
+              ctx.lineWidth = state.sw * 0.01;
+              ctx.stroke(path);
+            }}
+          }}
+        }}
+
+        const start = performance.now();
+        function tick(now) {{
+          const frame = Math.floor(((now - start) / 1000) * timeline.fps);
+          draw(Math.min(frame, timeline.frames - 1));
+          if (frame < timeline.frames) requestAnimationFrame(tick);
+        }}
+        requestAnimationFrame(tick);
+      }});
+    </script>
+  </body>
+</html>
+"""
+
+
+def normalize_points(points):
+    """
+    Maps points into a box from -1 to 1 around their center.
+
+    Returns:
+        tuple: The center, the half width and height, and the mapped points
+    """
+    low, high = points.min(axis=0), points.max(axis=0)
+    center = (low + high) / 2
+    # A flat shape (e.g. a horizontal line) keeps its unit in that direction
+    half_size = np.where(high - low > 1e-6, (high - low) / 2, 1)
+    return center, half_size, (points - center) / half_size
+
+
+def path_data(vmobject, points):
+    """
+    Converts points in the layout of a VMobject's points to SVG path data.
+    """
+    points = np.round(points, 4)
+    commands = []
+    for subpath in vmobject.gen_subpaths_from_points_2d(points):
+        commands.append("M{:g} {:g}".format(*subpath[0][:2]))
+        for _p0, p1, p2, p3 in vmobject.gen_cubic_bezier_tuples_from_points(subpath):
+            commands.append(
+                "C{:g} {:g} {:g} {:g} {:g} {:g}".format(*p1[:2], *p2[:2], *p3[:2])
+            )
+        if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            commands.append("Z")
+    return "".join(commands)
+
+
+def drawn_fraction(points, full_points):
+    """
+    Finds how much of a path is drawn, as VMobject.pointwise_become_partial
+    does for Create and Write.
+
+    Returns:
+        float: The upper bound passed to pointwise_become_partial, or None if
+            the points aren't the start of the full path
+    """
+    num_curves, num_full_curves = len(points) // 4, len(full_points) // 4
+    if not 0 < num_curves <= num_full_curves:
+        return None
+    # Every curve but the last is copied, the last is split at some t
+    index = 4 * (num_curves - 1)
+    if not np.allclose(points[: index + 1], full_points[: index + 1], atol=1e-6):
+        return None
+    p0, p1, p2, p3 = full_points[index : index + 4]
+    t = np.linspace(0, 1, 1025)[:, np.newaxis]
+    curve = (
+        (1 - t) ** 3 * p0
+        + 3 * (1 - t) ** 2 * t * p1
+        + 3 * (1 - t) * t**2 * p2
+        + t**3 * p3
+    )
+    distances = np.linalg.norm(curve - points[-1], axis=1)
+    if distances.min() > 1e-3:
+        return None
+    return (num_curves - 1 + float(t[distances.argmin(), 0])) / num_full_curves
+
+
+def drawn_mobjects(scene):
+    """
+    Returns the full shapes of the submobjects Create or Write is drawing, by id.
+    """
+    full_shapes = {}
+    animations = list(scene.animations or [])
+    while animations:
+        animation = animations.pop()
+        if isinstance(animation, AnimationGroup):
+            animations.extend(animation.animations)
+        elif isinstance(animation, (ShowPartial, DrawBorderThenFill)):
+            for submobject, start, *_ in animation.get_all_families_zipped():
+                full_shapes[id(submobject)] = start
+    return full_shapes
+
+
+class VectorTimelineRendererMixin:
+    """
+    CairoRenderer mixin that records the scene as a keyframed vector timeline.
+
+    Every frame, each VMobject on screen is stored as a path normalized to
+    its size, a position, a scale, colors, opacities and a stacking order.
+    While Create or Write draws a VMobject, its full path is stored with the
+    fraction drawn so far. Only the values that changed since the layer's
+    previous keyframe are written, and identical path data is stored once, so
+    moved or scaled shapes, copies of the same shape and repeated glyphs share
+    one path. ImageMobjects are embedded once as PNG.
+
+    The timeline is written next to the movie as ``<scene>.json`` together
+    with a ``<scene>.html`` player that draws it on a canvas. Cached plays
+    aren't rendered and so can't be recorded, so caching must be disabled.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timeline_frame = 0
+        self.timeline_paths = {}
+        # Normalized points and path id of each VMobject's last path
+        self.timeline_shapes = {}
+        self.timeline_images = {}
+        self.timeline_layers = {}
+        self.timeline_camera = []
+        self.timeline_last_camera = None
+
+    def record_frame(self, scene):
+        """
+        Adds the state of every mobject on screen as keyframes of the current frame.
+        """
+        frame_center = self.camera.frame_center
+        camera = {
+            "x": round(float(frame_center[0]), 3),
+            "y": round(float(frame_center[1]), 3),
+            "w": round(float(self.camera.frame_width), 3),
+        }
+        if camera != self.timeline_last_camera:
+            self.timeline_camera.append({"f": self.timeline_frame, **camera})
+            self.timeline_last_camera = camera
+
+        mobjects = extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            use_z_index=self.camera.use_z_index,
+            only_those_with_points=True,
+        )
+        full_shapes = drawn_mobjects(scene)
+        on_screen = set()
+        for z, mobject in enumerate(mobjects):
+            if isinstance(mobject, VMobject):
+                state = self.vmobject_state(mobject, full_shapes.get(id(mobject)))
+            elif isinstance(mobject, AbstractImageMobject):
+                state = self.image_state(mobject)
+            else:
+                continue
+            state["z"] = z
+            on_screen.add(id(mobject))
+            self.add_keyframe(mobject, state)
+
+        for layer_id, layer in self.timeline_layers.items():
+            if layer_id not in on_screen and not layer["state"].get("hidden"):
+                self.add_keyframe(layer["mobject"], {"hidden": True})
+
+    def vmobject_state(self, vmobject, full_shape=None):
+        points, drawn = vmobject.points, 1
+        if full_shape is not None:
+            fraction = drawn_fraction(points, full_shape.points)
+            if fraction is not None:
+                points, drawn = full_shape.points, round(fraction, 4)
+        center, half_size, normalized = normalize_points(points)
+
+        # Keep the path while its shape only moves (with rounding noise)
+        last_points, path_id = self.timeline_shapes.get(id(vmobject), (None, None))
+        if last_points is None or not (
+            last_points.shape == normalized.shape
+            and np.allclose(last_points, normalized, atol=2e-4)
+        ):
+            path = path_data(vmobject, normalized)
+            path_id = self.timeline_paths.setdefault(
+                path, f"p{len(self.timeline_paths)}"
+            )
+            self.timeline_shapes[id(vmobject)] = (normalized, path_id)
+        return {
+            "path": path_id,
+            "b": drawn,
+            "x": round(float(center[0]), 3),
+            "y": round(float(center[1]), 3),
+            "sx": round(float(half_size[0]), 4),
+            "sy": round(float(half_size[1]), 4),
+            "fill": vmobject.get_fill_color().to_hex(),
+            "fo": round(float(vmobject.get_fill_opacity()), 3),
+            "stroke": vmobject.get_stroke_color().to_hex(),
+            "so": round(float(vmobject.get_stroke_opacity()), 3),
+            "sw": round(float(vmobject.get_stroke_width()), 3),
+        }
+
+    def image_state(self, image):
+        image_id, full_alpha, _ = self.timeline_images.get(id(image), (None, 0, None))
+        pixel_array = image.get_pixel_array()
+        if image_id is None:
+            buffer = io.BytesIO()
+            Image.fromarray(pixel_array).save(buffer, format="png")
+            image_id = f"i{len(self.timeline_images)}"
+            full_alpha = max(int(pixel_array[:, :, 3].max()), 1)
+            self.timeline_images[id(image)] = (
+                image_id,
+                full_alpha,
+                "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode(),
+            )
+        center = image.get_center()
+        return {
+            "image": image_id,
+            "x": round(float(center[0]), 3),
+            "y": round(float(center[1]), 3),
+            "w": round(float(image.width), 3),
+            "h": round(float(image.height), 3),
+            # Fades change the alpha channel of the pixel array itself
+            "o": round(int(pixel_array[:, :, 3].max()) / full_alpha, 3),
+        }
+
+    def add_keyframe(self, mobject, state):
+        # Layers keep their mobject alive, so its id is never reused
+        layer = self.timeline_layers.setdefault(
+            id(mobject), {"mobject": mobject, "state": {}, "keyframes": []}
+        )
+        if state.get("hidden"):
+            changes = {"hidden": True}
+        else:
+            changes = {k: v for k, v in state.items() if layer["state"].get(k) != v}
+            if layer["state"].get("hidden"):
+                changes["hidden"] = False
+        if changes:
+            layer["keyframes"].append({"f": self.timeline_frame, **changes})
+            layer["state"].update(changes)
+
+    def render(self, scene, time, moving_mobjects):
+        super().render(scene, time, moving_mobjects)
+        # Skipped plays (e.g. outside -n) add no frames to the movie either
+        if not self.skip_animations:
+            self.record_frame(scene)
+            self.timeline_frame += 1
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        # Static waits freeze one frame instead of rendering each of them
+        if scene.is_current_animation_frozen_frame() and not self.skip_animations:
+            self.record_frame(scene)
+            self.timeline_frame += int(scene.duration * self.camera.frame_rate)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        if not hasattr(self.file_writer, "movie_file_path"):
+            return
+
+        timeline = {
+            "fps": self.camera.frame_rate,
+            "frames": self.timeline_frame,
+            "width": self.camera.pixel_width,
+            "height": self.camera.pixel_height,
+            "background": self.camera.background_color.to_hex(),
+            "camera": self.timeline_camera,
+            "paths": {path_id: path for path, path_id in self.timeline_paths.items()},
+            "images": {
+                image_id: data for image_id, _, data in self.timeline_images.values()
+            },
+            "layers": [
+                {"keyframes": layer["keyframes"]}
+                for layer in self.timeline_layers.values()
+            ],
+        }
+        timeline_path = self.file_writer.movie_file_path.with_suffix(".json")
+        timeline_path.write_text(
+            json.dumps(timeline, separators=(",", ":")), encoding="utf-8"
+        )
+        timeline_path.with_suffix(".html").write_text(
+            PLAYER_HTML.format(title=timeline_path.stem, timeline=timeline_path.name),
+            encoding="utf-8",
+        )
+        size = timeline_path.stat().st_size
+        movie_path = self.file_writer.movie_file_path
+        movie = ""
+        if movie_path.exists():
+            movie = f", {size / movie_path.stat().st_size:.1%} of the movie's size"
+        logger.info(
+            "Vector timeline written to %(path)s "
+            "(%(size).1f kB, %(paths)i unique paths%(movie)s)",
+            {
+                "path": str(timeline_path),
+                "size": size / 1e3,
+                "paths": len(self.timeline_paths),
+                "movie": movie,
+            },
+        )